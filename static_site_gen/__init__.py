@@ -5,10 +5,29 @@ This package provides functionality to convert Markdown files with YAML front ma
 into a clean HTML blog with template-based rendering.
 """
 
+from typing import TYPE_CHECKING, Any
+
 __version__ = "0.1.0"
 __author__ = "John Mulder"
 
 from .cli import main
-from .generator.core import SiteGenerator
+
+if TYPE_CHECKING:
+    from .generator.core import SiteGenerator
 
 __all__ = ["main", "SiteGenerator"]
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import SiteGenerator on first access (PEP 562).
+
+    The generator core pulls in process pools and the rest of the build
+    machinery, which the CLI entry point does not need for --help or init.
+    """
+    if name == "SiteGenerator":
+        # pylint: disable-next=import-outside-toplevel
+        from .generator.core import SiteGenerator
+
+        return SiteGenerator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -11,12 +11,9 @@ import sys
 from collections.abc import Callable
 from datetime import date
 from pathlib import Path
-from typing import cast
+from typing import Any, cast
 
-import yaml
-from jinja2 import TemplateNotFound
-
-from .generator.core import SiteGenerator
+from .generator import __version__
 
 # ---------------------------------------------------------------------------
 # Default scaffolding content embedded as strings so ``init`` works without
@@ -73,6 +70,7 @@ a { color: #0366d6; }
 pre { background: #f6f8fa; padding: 1rem; overflow-x: auto; }
 code { font-size: 0.9em; }
 """
+_DEFAULT_STYLE_BYTES = _DEFAULT_STYLE.encode("utf-8")
 
 
 def cmd_build(args: argparse.Namespace) -> int:
@@ -82,14 +80,23 @@ def cmd_build(args: argparse.Namespace) -> int:
     Args:
         args: Parsed command-line arguments
     """
+    # Lazy imports -- the build pipeline pulls in Jinja2, Markdown, and PyYAML,
+    # which other commands (and --help) should not pay for.
+    import yaml  # pylint: disable=import-outside-toplevel
+    from jinja2 import TemplateNotFound  # pylint: disable=import-outside-toplevel
+
+    from .generator.core import (  # pylint: disable=import-outside-toplevel
+        SiteGenerator,
+    )
+
     logging.basicConfig(
         level=logging.INFO,
         format="%(message)s",
     )
     try:
         project_root = Path(args.project_dir).resolve()
-        generator = SiteGenerator(project_root)
-        generator.build(include_drafts=args.drafts)
+        generator = SiteGenerator(project_root, jobs=args.jobs)
+        generator.build(include_drafts=args.drafts, force=args.force)
         return 0
     except FileNotFoundError as e:
         print(f"Error: {e}")
@@ -148,6 +155,8 @@ def cmd_init(args: argparse.Namespace) -> int:
     Args:
         args: Parsed command-line arguments (expects ``project_name``)
     """
+    from .generator.output import write_file  # pylint: disable=import-outside-toplevel
+
     project_dir = Path(args.project_name).resolve()
 
     if project_dir.exists() and any(project_dir.iterdir()):
@@ -167,20 +176,25 @@ def cmd_init(args: argparse.Namespace) -> int:
         for d in dirs:
             d.mkdir(parents=True, exist_ok=True)
 
-        # Config
-        config_text = _DEFAULT_CONFIG.format(site_name=args.project_name)
-        (project_dir / "config.yaml").write_text(config_text)
-
-        # Sample content
-        first_post = _DEFAULT_FIRST_POST.format(today=today)
-        filename = f"{today}-hello-world.md"
-        (project_dir / "content" / "posts" / filename).write_text(first_post)
-
-        about_page = _DEFAULT_ABOUT_PAGE.format(today=today)
-        (project_dir / "content" / "pages" / "about.md").write_text(about_page)
-
-        # Stylesheet
-        (project_dir / "static" / "style.css").write_text(_DEFAULT_STYLE)
+        # Config, sample content, and stylesheet, each encoded once and
+        # written through the atomic binary writer used for site output.
+        scaffold_files: list[tuple[Path, str | bytes]] = [
+            (
+                project_dir / "config.yaml",
+                _DEFAULT_CONFIG.format(site_name=args.project_name),
+            ),
+            (
+                project_dir / "content" / "posts" / f"{today}-hello-world.md",
+                _DEFAULT_FIRST_POST.format(today=today),
+            ),
+            (
+                project_dir / "content" / "pages" / "about.md",
+                _DEFAULT_ABOUT_PAGE.format(today=today),
+            ),
+            (project_dir / "static" / "style.css", _DEFAULT_STYLE_BYTES),
+        ]
+        for path, content in scaffold_files:
+            write_file(path, content, assume_dir_exists=True)
 
         # Copy real templates from the package's sibling templates/ directory
         # (works when running from a source checkout or editable install).
@@ -208,20 +222,19 @@ def cmd_init(args: argparse.Namespace) -> int:
         return 1
 
 
-def create_parser() -> argparse.ArgumentParser:
-    """
-    Create command-line argument parser.
-
-    Returns:
-        Configured ArgumentParser instance
-    """
-    parser = argparse.ArgumentParser(
-        prog="static-site-gen", description="A minimal Python static site generator"
-    )
+def _non_negative_int(value: str) -> int:
+    """Parse a command-line integer that must be 0 or greater."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'") from None
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be 0 or greater, got {number}")
+    return number
 
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
-    # Build command
+def _add_build_parser(subparsers: Any) -> None:
+    """Register the ``build`` subcommand."""
     build_parser = subparsers.add_parser("build", help="Build static site")
     build_parser.add_argument(
         "--project-dir",
@@ -234,14 +247,31 @@ def create_parser() -> argparse.ArgumentParser:
         default=False,
         help="Include draft posts in the build",
     )
+    build_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=_non_negative_int,
+        default=0,
+        help="Parallel workers; 1 builds serially (default: 0, chosen automatically)",
+    )
+    build_parser.add_argument(
+        "--force",
+        action="store_true",
+        default=False,
+        help="Discard the build cache in .cache/ and rebuild every page",
+    )
     build_parser.set_defaults(func=cmd_build)
 
-    # Init command
+
+def _add_init_parser(subparsers: Any) -> None:
+    """Register the ``init`` subcommand."""
     init_parser = subparsers.add_parser("init", help="Initialize new site project")
     init_parser.add_argument("project_name", help="Name of the new project")
     init_parser.set_defaults(func=cmd_init)
 
-    # Serve command
+
+def _add_serve_parser(subparsers: Any) -> None:
+    """Register the ``serve`` subcommand."""
     serve_parser = subparsers.add_parser("serve", help="Start local development server")
     serve_parser.add_argument(
         "--project-dir",
@@ -256,6 +286,42 @@ def create_parser() -> argparse.ArgumentParser:
     )
     serve_parser.set_defaults(func=cmd_serve)
 
+
+# Subcommand name -> function that registers it, in help-listing order.
+_SUBCOMMANDS: dict[str, Callable[[Any], None]] = {
+    "build": _add_build_parser,
+    "init": _add_init_parser,
+    "serve": _add_serve_parser,
+}
+
+
+def create_parser(command: str | None = None) -> argparse.ArgumentParser:
+    """
+    Create command-line argument parser.
+
+    Args:
+        command: Subcommand about to be parsed. When it names a known
+            subcommand only that one is registered; otherwise all are, so
+            top-level help and invalid-choice errors list every command.
+
+    Returns:
+        Configured ArgumentParser instance
+    """
+    parser = argparse.ArgumentParser(
+        prog="static-site-gen", description="A minimal Python static site generator"
+    )
+    parser.add_argument(
+        "-v", "--version", action="version", version=f"%(prog)s {__version__}"
+    )
+
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+
+    if command in _SUBCOMMANDS:
+        _SUBCOMMANDS[command](subparsers)
+    else:
+        for add_subparser in _SUBCOMMANDS.values():
+            add_subparser(subparsers)
+
     return parser
 
 
@@ -266,7 +332,14 @@ def main() -> int:
     Returns:
         Exit code (0 for success, 1 for error)
     """
-    parser = create_parser()
+    # Answer --version without building the parser at all.
+    if sys.argv[1:] in (["-v"], ["--version"]):
+        print(f"static-site-gen {__version__}")
+        return 0
+
+    # The first non-option argument is the subcommand; build only its parser.
+    command = next((arg for arg in sys.argv[1:] if not arg.startswith("-")), None)
+    parser = create_parser(command)
 
     if len(sys.argv) == 1:
         parser.print_help()
@@ -0,0 +1,155 @@
+"""
+Site configuration loading and validation.
+
+This module defines SiteConfig, the validated form of a project's
+config.yaml, and the cached loader behind SiteConfig.from_yaml.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlparse
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+# Fields every config.yaml must set to a non-empty string.
+_REQUIRED_FIELDS = ("site_name", "base_url", "author")
+
+
+@dataclass
+class SiteConfig:  # pylint: disable=too-many-instance-attributes
+    """
+    Validated site configuration.
+
+    All required fields are guaranteed present after construction.
+    Optional fields carry sensible defaults.
+
+    Attributes are kept flat for simplicity -- the config surface is small
+    enough that nested dataclasses would add indirection without clarity.
+    """
+
+    site_name: str
+    base_url: str
+    author: str
+    timezone: str = "UTC"
+    output_dir: str = "site"
+    posts_per_page: int = 10
+    description: str = ""
+    keywords: list[str] = field(default_factory=list)
+    markdown_extensions: list[str] = field(
+        default_factory=lambda: ["codehilite", "tables", "toc"]
+    )
+
+    @classmethod
+    def from_yaml(cls, filepath: Path) -> SiteConfig:
+        """
+        Load and validate configuration from a YAML file.
+
+        Args:
+            filepath: Path to config.yaml
+
+        Returns:
+            Validated SiteConfig instance
+
+        Raises:
+            FileNotFoundError: If config file doesn't exist
+            ValueError: If required fields are missing or invalid
+        """
+        if not filepath.exists():
+            raise FileNotFoundError(f"Configuration file not found: {filepath}")
+
+        # Watch loops and test suites load the same config over and over;
+        # the parsed result is cached on the file's bytes, and each caller
+        # gets its own copy so mutating it cannot leak into the cache.
+        config = _load_site_config(filepath.read_bytes())
+        return replace(
+            config,
+            keywords=list(config.keywords),
+            markdown_extensions=list(config.markdown_extensions),
+        )
+
+    @classmethod
+    def from_yaml_bytes(cls, data: bytes) -> SiteConfig:
+        """
+        Parse and validate configuration from the bytes of a YAML file.
+
+        Args:
+            data: Raw config.yaml contents
+
+        Returns:
+            Validated SiteConfig instance
+
+        Raises:
+            ValueError: If required fields are missing or invalid
+        """
+        import yaml  # pylint: disable=import-outside-toplevel
+
+        # The parser's loader is libyaml's C loader where PyYAML was built
+        # with it; given bytes it also does the UTF-8 decoding in C.
+        from .parser import _SafeLoader  # pylint: disable=import-outside-toplevel
+
+        raw = yaml.load(data, Loader=_SafeLoader)
+
+        if raw is None:
+            raise ValueError("Configuration file is empty or invalid")
+
+        missing = [f for f in _REQUIRED_FIELDS if f not in raw]
+        if missing:
+            raise ValueError(f"Missing required config fields: {missing}")
+
+        invalid = [
+            _required_field_error(name, raw[name])
+            for name in _REQUIRED_FIELDS
+            if not (isinstance(raw[name], str) and raw[name].strip())
+        ]
+        if invalid:
+            raise ValueError(f"Invalid required config fields: {', '.join(invalid)}")
+
+        posts_per_page = raw.get("posts_per_page", 10)
+        if not isinstance(posts_per_page, int) or posts_per_page <= 0:
+            raise ValueError(
+                f"posts_per_page must be a positive integer, got: {posts_per_page}"
+            )
+
+        parsed_url = urlparse(raw["base_url"])
+        if parsed_url.scheme not in {"http", "https"} or not parsed_url.netloc:
+            raise ValueError(
+                f"base_url must be a valid absolute HTTP/HTTPS URL, got: {raw['base_url']}"
+            )
+
+        timezone = raw.get("timezone", "UTC")
+        try:
+            ZoneInfo(timezone)
+        except ZoneInfoNotFoundError as exc:
+            raise ValueError(f"Invalid timezone setting: {timezone}") from exc
+
+        return cls(
+            site_name=raw["site_name"],
+            base_url=raw["base_url"],
+            author=raw["author"],
+            timezone=timezone,
+            output_dir=raw.get("output_dir", "site"),
+            posts_per_page=posts_per_page,
+            description=raw.get("description", ""),
+            keywords=raw.get("keywords", []),
+            markdown_extensions=raw.get(
+                "markdown_extensions", ["codehilite", "tables", "toc"]
+            ),
+        )
+
+
+def _required_field_error(name: str, value: Any) -> str:
+    """Describe why a required field's value is not a non-empty string."""
+    if value is None:
+        return f"{name} is null"
+    if not isinstance(value, str):
+        return f"{name} must be a string, got {type(value).__name__}"
+    return f"{name} is empty"
+
+
+@lru_cache(maxsize=32)
+def _load_site_config(data: bytes) -> SiteConfig:
+    """Parse config bytes once per distinct content; see SiteConfig.from_yaml."""
+    return SiteConfig.from_yaml_bytes(data)
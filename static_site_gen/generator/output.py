@@ -6,12 +6,44 @@ from URL patterns, writing rendered content, copying static assets, and
 organizing posts for pagination and tag archives.
 """
 
+import hashlib
+import json
+import operator
+import os
 import shutil
+import stat
 import urllib.parse
-from collections import defaultdict
+from collections.abc import Iterable
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+# Top-level output paths the build writes itself: the copied static assets
+# and the tag index. Pages with one of these slugs are renamed.
+RESERVED_PAGE_SLUGS = frozenset({"static", "tag"})
+
+# C-level sort key; avoids a Python frame per comparison.
+_post_date = operator.itemgetter("date")
+
+# Deletes every character urllib.parse.quote leaves alone; a segment that
+# translates to "" needs no quoting.
+_URL_SAFE_DELETE = str.maketrans(
+    dict.fromkeys("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_.-~")
+)
+
+
+def _quote_segment(segment: str) -> str:
+    """
+    Percent-encode one URL path segment.
+
+    Slugs and tags are nearly always plain ASCII words, so those are
+    detected with a single C-level translate and returned as-is instead of
+    going through urllib.parse.quote.
+    """
+    if not segment.translate(_URL_SAFE_DELETE):
+        return segment
+    return urllib.parse.quote(segment, safe="")
+
 
 def ensure_dir(path: Path) -> None:
     """
@@ -23,10 +55,26 @@ def ensure_dir(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
+def ensure_dirs(paths: Iterable[Path]) -> None:
+    """
+    Create several directories, each distinct path once.
+
+    Args:
+        paths: Directory paths to create; duplicates are ignored
+    """
+    for path in sorted(set(paths)):
+        ensure_dir(path)
+
+
 def copy_static_files(source_dir: Path, dest_dir: Path) -> None:
     """
     Copy all files from source directory to destination directory.
 
+    The copy is incremental: files whose size and modification time already
+    match the source are left alone, and anything in dest_dir that no longer
+    exists in source_dir is removed. Copies keep the source mtime, so an
+    unchanged asset is never rewritten on a later build.
+
     Args:
         source_dir: Source directory containing static files
         dest_dir: Destination directory for copied files
@@ -37,26 +85,110 @@ def copy_static_files(source_dir: Path, dest_dir: Path) -> None:
     if not source_dir.exists():
         raise FileNotFoundError(f"Static source directory not found: {source_dir}")
 
-    if dest_dir.exists():
-        shutil.rmtree(dest_dir)
-
-    shutil.copytree(source_dir, dest_dir)
+    if dest_dir.exists() and not dest_dir.is_dir():
+        dest_dir.unlink()
+    dest_dir.mkdir(parents=True, exist_ok=True)
+
+    expected: set[str] = set()
+    for dirpath, dirnames, filenames in os.walk(source_dir, followlinks=True):
+        rel_dir = os.path.relpath(dirpath, source_dir)
+        for name in dirnames:
+            rel = os.path.normpath(os.path.join(rel_dir, name))
+            expected.add(rel)
+            dst = dest_dir / rel
+            if not dst.is_dir():
+                _remove_path(dst)
+                dst.mkdir()
+        for name in filenames:
+            rel = os.path.normpath(os.path.join(rel_dir, name))
+            expected.add(rel)
+            src = os.path.join(dirpath, name)
+            dst = dest_dir / rel
+            if not _is_same_file_state(src, dst):
+                _remove_path(dst)
+                _copy_file(src, str(dst))
+
+    # Bottom-up so a directory is emptied before it is considered.
+    for dirpath, dirnames, filenames in os.walk(dest_dir, topdown=False):
+        rel_dir = os.path.relpath(dirpath, dest_dir)
+        for name in filenames + dirnames:
+            if os.path.normpath(os.path.join(rel_dir, name)) not in expected:
+                _remove_path(Path(dirpath) / name)
+
+
+def _is_same_file_state(src: str, dst: Path) -> bool:
+    """Whether dst is a regular file with the same size and mtime as src."""
+    try:
+        dst_stat = dst.stat(follow_symlinks=False)
+    except FileNotFoundError:
+        return False
+    src_stat = os.stat(src)
+    return (
+        stat.S_ISREG(dst_stat.st_mode)
+        and dst_stat.st_size == src_stat.st_size
+        and dst_stat.st_mtime_ns == src_stat.st_mtime_ns
+    )
+
+
+def _remove_path(path: Path) -> None:
+    """Remove a file, symlink, or directory tree if it exists."""
+    if path.is_dir() and not path.is_symlink():
+        shutil.rmtree(path)
+    else:
+        path.unlink(missing_ok=True)
+
+
+def _copy_file(src: str, dst: str) -> None:
+    """
+    Copy one file with its metadata, letting the kernel move the bytes.
 
+    os.copy_file_range copies inside the kernel and shares extents on
+    copy-on-write filesystems (btrfs, XFS), so assets cost no user-space
+    reads or writes. Where it is unavailable or refused, this falls back to
+    shutil.copy2. Hardlinks are not used: a post-processing step that edits
+    the output in place would then silently modify the source assets.
 
+    Args:
+        src: Source file path
+        dst: Destination file path; its parent directory must exist
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            if remaining == 0:
+                shutil.copystat(src, dst)
+                return
+        except OSError:
+            # e.g. EXDEV on older kernels or unsupported filesystems.
+            pass
+
+    shutil.copy2(src, dst)
+
+
+@lru_cache(maxsize=4096)
 def generate_post_url(slug: str) -> str:
     """
     Generate clean URL path for a blog post.
 
+    The URL generators are pure and called for the same slug or tag by
+    several build steps, so each is memoized.
+
     Args:
         slug: Post slug identifier
 
     Returns:
         URL path in format: /posts/<slug>/
     """
-    encoded_slug = urllib.parse.quote(slug, safe="")
-    return f"/posts/{encoded_slug}/"
+    return f"/posts/{_quote_segment(slug)}/"
 
 
+@lru_cache(maxsize=4096)
 def generate_tag_url(tag: str) -> str:
     """
     Generate clean URL path for a tag archive page.
@@ -67,10 +199,10 @@ def generate_tag_url(tag: str) -> str:
     Returns:
         URL path in format: /tag/<tag>/
     """
-    encoded_tag = urllib.parse.quote(tag, safe="")
-    return f"/tag/{encoded_tag}/"
+    return f"/tag/{_quote_segment(tag)}/"
 
 
+@lru_cache(maxsize=4096)
 def generate_page_url(slug: str) -> str:
     """
     Generate clean URL path for a static page.
@@ -81,17 +213,19 @@ def generate_page_url(slug: str) -> str:
     Returns:
         URL path in format: /<slug>/
     """
-    encoded_slug = urllib.parse.quote(slug, safe="")
-    return f"/{encoded_slug}/"
+    return f"/{_quote_segment(slug)}/"
 
 
-def get_output_path(base_dir: Path, url_path: str) -> Path:
+def get_output_path(
+    base_dir: Path, url_path: str, resolved_base: Path | None = None
+) -> Path:
     """
     Convert URL path to filesystem path for output.
 
     Args:
         base_dir: Base output directory
         url_path: URL path (e.g., "/posts/my-post/")
+        resolved_base: base_dir.resolve(), when converting many paths
 
     Returns:
         Filesystem path with index.html (e.g., "site/posts/my-post/index.html")
@@ -123,7 +257,8 @@ def get_output_path(base_dir: Path, url_path: str) -> Path:
     output_path = base_dir.joinpath(*parts) / "index.html"
 
     try:
-        resolved_base = base_dir.resolve()
+        if resolved_base is None:
+            resolved_base = base_dir.resolve()
         resolved_output = output_path.resolve()
 
         resolved_output.relative_to(resolved_base)
@@ -133,16 +268,71 @@ def get_output_path(base_dir: Path, url_path: str) -> Path:
     return output_path
 
 
-def write_file(path: Path, content: str) -> None:
+def prepare_output_paths(output_dir: Path, url_paths: Iterable[str]) -> dict[str, Path]:
+    """
+    Create the output directories for a batch of URL paths up front.
+
+    Each distinct directory is created once, serially, so the concurrent
+    writers that follow skip the mkdir calls. Invalid paths and mkdir
+    failures are skipped here; the per-item task hits the same error
+    when it writes and logs it against that item.
+
+    Args:
+        output_dir: Output directory the URL paths are resolved against
+        url_paths: URL paths that will be written under output_dir
+
+    Returns:
+        Output file path of each valid URL path, so writers need not
+        validate and resolve it again
+    """
+    resolved_base = output_dir.resolve()
+    output_paths = {}
+    for url_path in url_paths:
+        try:
+            output_paths[url_path] = get_output_path(
+                output_dir, url_path, resolved_base
+            )
+        except ValueError:
+            continue
+
+    for directory in sorted({path.parent for path in output_paths.values()}):
+        try:
+            ensure_dir(directory)
+        except OSError:
+            continue
+    return output_paths
+
+
+def write_file(
+    path: Path, content: str | bytes, assume_dir_exists: bool = False
+) -> None:
     """
     Write content to file, creating directories as needed.
 
+    Text is encoded to UTF-8 once and written in binary mode, skipping the
+    text I/O layer and its newline translation, so output bytes are
+    identical on every platform. The bytes go to a temporary sibling through
+    a buffered writer, which retries short writes until every byte is on
+    disk, and are then renamed over path, so an interrupted build never
+    leaves a truncated page behind.
+
     Args:
         path: File path to write to
-        content: Content to write
+        content: Content to write (str is encoded as UTF-8)
+        assume_dir_exists: Skip creating the parent directory, for callers
+            that have already created it
     """
-    ensure_dir(path.parent)
-    path.write_text(content, encoding="utf-8")
+    data = content.encode("utf-8") if isinstance(content, str) else content
+    if not assume_dir_exists:
+        ensure_dir(path.parent)
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 
 def collect_posts_by_tag(
@@ -151,20 +341,29 @@ def collect_posts_by_tag(
     """
     Group posts by their tags.
 
+    Posts keep their input order within each tag, so grouping a list that is
+    already sorted by date yields groups that need no further sorting.
+
     Args:
         posts: List of post dictionaries with 'tags' field
 
     Returns:
         Dictionary mapping tag names to lists of posts
     """
-    posts_by_tag = defaultdict(list)
+    posts_by_tag: dict[str, list[dict[str, Any]]] = {}
 
     for post in posts:
-        tags = post.get("tags", [])
+        tags = post.get("tags")
+        if not tags:
+            continue
         for tag in tags:
-            posts_by_tag[tag].append(post)
+            tag_posts = posts_by_tag.get(tag)
+            if tag_posts is None:
+                posts_by_tag[tag] = [post]
+            else:
+                tag_posts.append(post)
 
-    return dict(posts_by_tag)
+    return posts_by_tag
 
 
 def sort_posts_by_date(
@@ -180,7 +379,7 @@ def sort_posts_by_date(
     Returns:
         Sorted list of posts
     """
-    return sorted(posts, key=lambda p: p["date"], reverse=reverse)
+    return sorted(posts, key=_post_date, reverse=reverse)
 
 
 def filter_published_posts(posts: list[dict[str, Any]]) -> list[dict[str, Any]]:
@@ -196,12 +395,39 @@ def filter_published_posts(posts: list[dict[str, Any]]) -> list[dict[str, Any]]:
     return [post for post in posts if not post.get("draft", False)]
 
 
-def clean_output_dir(output_dir: Path) -> None:
+def prepare_posts(
+    posts: list[dict[str, Any]], include_drafts: bool = False
+) -> tuple[list[dict[str, Any]], dict[str, list[dict[str, Any]]]]:
+    """
+    Filter, sort, and group posts for listing pages in one step.
+
+    Equivalent to filter_published_posts, then sort_posts_by_date, then
+    collect_posts_by_tag, but sorts a single list in place and groups the
+    sorted result, so every tag's posts are already newest first.
+
+    Args:
+        posts: List of post dictionaries with 'date' and 'tags' fields
+        include_drafts: Keep draft posts instead of filtering them out
+
+    Returns:
+        Tuple of (posts newest first, mapping of tag to its posts newest first)
+    """
+    if include_drafts:
+        prepared = list(posts)
+    else:
+        prepared = [post for post in posts if not post.get("draft", False)]
+    prepared.sort(key=_post_date, reverse=True)
+    return prepared, collect_posts_by_tag(prepared)
+
+
+def clean_output_dir(output_dir: Path, keep: Iterable[str] = ()) -> None:
     """
     Remove and recreate output directory.
 
     Args:
         output_dir: Directory to clean and recreate
+        keep: Names of top-level entries to leave in place, for outputs that
+            are synchronized incrementally rather than regenerated
 
     Raises:
         ValueError: If output directory path appears unsafe
@@ -221,11 +447,237 @@ def clean_output_dir(output_dir: Path) -> None:
             f"Directory appears to contain user files, refusing to clean: {resolved_output}"
         )
 
+    keep = set(keep)
+    if keep and output_dir.is_dir():
+        for entry in output_dir.iterdir():
+            if entry.name not in keep:
+                _remove_path(entry)
+        return
+
     if output_dir.exists():
         shutil.rmtree(output_dir)
     output_dir.mkdir(parents=True)
 
 
+def read_output_manifest(
+    manifest_path: Path, output_dir: Path, consume: bool = True
+) -> dict[str, Any]:
+    """
+    Read and invalidate the manifest of files a previous build wrote.
+
+    The manifest is deleted as it is read, so a build that fails part way
+    leaves none behind and the next build starts from a clean output dir.
+
+    Args:
+        manifest_path: Manifest file written by write_output_manifest
+        output_dir: Output directory the manifest must describe
+        consume: Delete the manifest after reading it; pass False to only
+            inspect it
+
+    Returns:
+        Mapping of output-relative path to file record, or an empty dict if
+        the manifest is missing, unreadable, or for another output directory
+    """
+    try:
+        manifest = json.loads(manifest_path.read_bytes())
+        if consume:
+            manifest_path.unlink()
+    except (OSError, ValueError):
+        return {}
+
+    if not isinstance(manifest, dict):
+        return {}
+    files = manifest.get("files")
+    if manifest.get("output_dir") != str(output_dir.resolve()):
+        return {}
+    return files if isinstance(files, dict) else {}
+
+
+def write_output_manifest(
+    manifest_path: Path, output_dir: Path, files: dict[str, Any]
+) -> None:
+    """
+    Write the manifest of files a build produced in output_dir.
+
+    Args:
+        manifest_path: File to write the manifest to
+        output_dir: Output directory the files are relative to
+        files: Mapping of output-relative path to file record
+    """
+    manifest = {"output_dir": str(output_dir.resolve()), "files": files}
+    # One compact dumps and a single write; json.dump would issue a write
+    # per encoded chunk.
+    write_file(
+        manifest_path,
+        json.dumps(manifest, separators=(",", ":")),
+        assume_dir_exists=True,
+    )
+
+
+def outputs_intact(output_dir: Path, files: dict[str, Any]) -> bool:
+    """
+    Check that files recorded in a manifest are still as the build left them.
+
+    Args:
+        output_dir: Output directory the files are relative to
+        files: Mapping of output-relative path to [digest, size, mtime_ns]
+
+    Returns:
+        True if every file exists with its recorded size and mtime
+    """
+    for relpath, record in files.items():
+        try:
+            st = (output_dir / relpath).stat()
+        except OSError:
+            return False
+        if [st.st_size, st.st_mtime_ns] != record[1:]:
+            return False
+    return True
+
+
+def static_files_intact(source_dir: Path, dest_dir: Path) -> bool:
+    """
+    Check that dest_dir still mirrors source_dir as copy_static_files left it.
+
+    Args:
+        source_dir: Static source directory (may not exist)
+        dest_dir: Copy of it under the output directory
+
+    Returns:
+        True if dest_dir holds exactly the source files, each with the
+        source size and mtime
+    """
+    expected = 0
+    for dirpath, _, filenames in os.walk(source_dir, followlinks=True):
+        rel_dir = os.path.relpath(dirpath, source_dir)
+        for name in filenames:
+            expected += 1
+            dst = dest_dir / rel_dir / name
+            if not _is_same_file_state(os.path.join(dirpath, name), dst):
+                return False
+    return expected == sum(len(names) for _, _, names in os.walk(dest_dir))
+
+
+def list_markdown_files(directory: Path) -> list[Path]:
+    """
+    List the Markdown files directly inside a directory, sorted by name.
+
+    Uses os.scandir, whose entries carry the file type from the directory
+    read itself, so classifying each entry needs no extra stat call, and a
+    missing directory is detected by scandir itself rather than a separate
+    exists() check. Sorting keeps slug collision resolution stable across
+    filesystems.
+
+    Args:
+        directory: Directory to scan (may not exist)
+
+    Returns:
+        Sorted list of .md file paths, empty if the directory is missing
+    """
+    try:
+        entries = os.scandir(directory)
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+    with entries:
+        return sorted(
+            Path(entry.path)
+            for entry in entries
+            if entry.name.endswith(".md") and entry.is_file()
+        )
+
+
+def fingerprint_files(
+    files: Iterable[Path], directories: Iterable[Path] = (), salt: str = ""
+) -> str:
+    """
+    Digest the path, size, and mtime of a set of input files.
+
+    Args:
+        files: Individual files; missing ones are recorded as missing
+        directories: Directories whose files are all included, recursively
+        salt: Extra text folded into the digest, e.g. build options
+
+    Returns:
+        Hex digest that changes when any file is added, removed, or touched
+    """
+    paths = [str(path) for path in files]
+    for directory in directories:
+        # Follow links as copy_static_files does, so a linked asset that
+        # changes is noticed.
+        for root, _, names in os.walk(directory, followlinks=True):
+            paths.extend(os.path.join(root, name) for name in names)
+
+    digest = hashlib.sha256(salt.encode("utf-8"))
+    for path in sorted(paths):
+        try:
+            st = os.stat(path)
+            entry = f"{path}\0{st.st_size}\0{st.st_mtime_ns}\n"
+        except OSError:
+            entry = f"{path}\0missing\n"
+        digest.update(entry.encode("utf-8", "surrogateescape"))
+    return digest.hexdigest()
+
+
+def remove_stale_files(output_dir: Path, paths: Iterable[str]) -> None:
+    """
+    Delete files from output_dir and prune directories they leave empty.
+
+    Args:
+        output_dir: Output directory; never removed itself
+        paths: File paths relative to output_dir
+    """
+    for relpath in paths:
+        path = output_dir / relpath
+        path.unlink(missing_ok=True)
+        parent = path.parent
+        while parent != output_dir and parent.is_dir() and not any(parent.iterdir()):
+            parent.rmdir()
+            parent = parent.parent
+
+
+def mark_cache_epoch(cache_dir: Path) -> int | None:
+    """
+    Touch a marker in cache_dir and return its mtime, the start of a build.
+
+    Every cache entry a build reads or writes ends up with an mtime at least
+    this new, so prune_cache_dir can drop the rest afterwards.
+
+    Args:
+        cache_dir: Build cache directory, created if missing
+
+    Returns:
+        Marker mtime in nanoseconds, or None if it could not be written
+    """
+    marker = cache_dir / "epoch"
+    try:
+        ensure_dir(cache_dir)
+        marker.touch()
+        return marker.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def prune_cache_dir(directory: Path, epoch: int) -> None:
+    """
+    Delete cache entries that the build started at epoch did not use.
+
+    Args:
+        directory: Cache directory holding one file per entry (may not exist)
+        epoch: Value returned by mark_cache_epoch when the build started
+    """
+    try:
+        entries = os.scandir(directory)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            try:
+                if entry.is_file() and entry.stat().st_mtime_ns < epoch:
+                    os.unlink(entry.path)
+            except OSError:
+                continue
+
+
 def paginate_posts(
     posts: list[dict[str, Any]], posts_per_page: int
 ) -> list[dict[str, Any]]:
@@ -7,10 +7,15 @@ and preparing content for rendering with HTML sanitization.
 
 import datetime as dt
 import hashlib
+import importlib.metadata
+import os
+import pickle
 import re
+import sys
 import unicodedata
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
@@ -18,6 +23,25 @@ from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 import markdown
 import yaml
 
+from . import __version__
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
+# Slug cleanup: drop anything that is not a word char, space, or hyphen,
+# then collapse runs of spaces/hyphens into a single hyphen.
+_SLUG_STRIP = re.compile(r"[^\w\s-]")
+_SLUG_DASH = re.compile(r"[-\s]+")
+# str.translate equivalent of _SLUG_STRIP for ASCII input.
+_ASCII_SLUG_STRIP = {
+    i: None for i in range(128) if _SLUG_STRIP.match(chr(i)) is not None
+}
+# Zero-padded forms of the formats parse_date accepts, which
+# datetime.fromisoformat parses identically to strptime but far faster.
+_ISO_DATE = re.compile(r"\d{4}-\d{2}-\d{2}(?: \d{2}:\d{2}(?::\d{2})?)?", re.ASCII)
+
 
 class ParseError(Exception):
     """Raised when content parsing fails."""
@@ -40,9 +64,14 @@ class ParseError(Exception):
         super().__init__(error_msg)
 
 
-@dataclass
+@dataclass(slots=True)
 class ContentMetadata:
-    """Container for parsed content metadata."""
+    """
+    Container for parsed content metadata.
+
+    Slotted: a large site holds one of these per post for the whole build,
+    and slots drop the per-instance __dict__ and speed up attribute reads.
+    """
 
     title: str
     date: datetime
@@ -53,32 +82,74 @@ class ContentMetadata:
 
     def __post_init__(self) -> None:
         """Normalize data after initialization."""
-        if self.tags is None:
-            self.tags = []
-        else:
-            self.tags = [tag.lower().strip() for tag in self.tags if tag.strip()]
+        # Tags repeat across posts and become dict keys when grouping, so
+        # intern them: equal tags then share one object and compare by identity.
+        self.tags = [
+            sys.intern(tag)
+            for tag in (raw.strip().lower() for raw in self.tags or ())
+            if tag
+        ]
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedContent:
-    """Container for fully parsed content."""
+    """
+    Container for fully parsed content.
+
+    The parser does not retain the source text: keeping every post's
+    Markdown alive alongside its rendered HTML roughly doubles resident
+    memory on large sites. raw_content is only set when a caller passes it;
+    read_raw_content() falls back to re-reading filepath.
+    """
 
     metadata: ContentMetadata
     content: str
-    raw_content: str
     filepath: Path
+    # Keyword-only: it used to sit before filepath, and a positional caller
+    # must fail rather than silently swap the two.
+    raw_content: str | None = field(default=None, kw_only=True)
+    _template_dict: dict[str, Any] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary for template rendering."""
-        return {
-            "title": self.metadata.title,
-            "date": self.metadata.date,
-            "slug": self.metadata.slug,
-            "tags": self.metadata.tags,
-            "draft": self.metadata.draft,
-            "description": self.metadata.description,
-            "content": self.content,
-        }
+        """
+        Convert to dictionary for template rendering.
+
+        The dictionary is built on first use and shared by every later call,
+        so the index, tag, feed, and sitemap passes all reference one dict
+        per post. Treat it as read-only; use dataclasses.replace() rather
+        than mutating fields to derive a changed copy.
+        """
+        if self._template_dict is None:
+            metadata = self.metadata
+            self._template_dict = {
+                "title": metadata.title,
+                "date": metadata.date,
+                "slug": metadata.slug,
+                "tags": metadata.tags,
+                "draft": metadata.draft,
+                "description": metadata.description,
+                "content": self.content,
+            }
+        return self._template_dict
+
+    def read_raw_content(self) -> str:
+        """
+        Return the source text of the content file.
+
+        The retained raw_content is returned when set; otherwise filepath is
+        read from disk, which reflects the file as it is now rather than as
+        it was when parsed.
+        """
+        if self.raw_content is not None:
+            return self.raw_content
+        return self.filepath.read_text(encoding="utf-8")
+
+
+# Field names pin the pickled layout in parse cache keys: entries written
+# before a field was added or reordered would unpickle into the wrong slots.
+_PARSED_LAYOUT = tuple(f.name for f in fields(ParsedContent))
 
 
 def extract_front_matter(content: str, filepath: Path) -> tuple[dict[str, Any], str]:
@@ -99,38 +170,31 @@ def extract_front_matter(content: str, filepath: Path) -> tuple[dict[str, Any],
         raise ParseError(
             "Missing YAML front matter (content must start with '---')", filepath
         )
-    try:
-        # Split on second occurrence of ---
-        parts = content.split("---", 2)
-        if len(parts) < 3:
-            raise ParseError(
-                "Malformed YAML front matter (missing closing '---')", filepath
-            )
-
-        # Check if we have both opening and closing delimiters
-        if parts[1].strip() == "" and len(parts) == 3:
-            # Handle case where content is just "---\n---"
-            pass
-        elif not parts[2]:
-            # No content after second ---
-            pass
-
-        _, front_matter_raw, markdown_body = parts
 
-        try:
-            front_matter = yaml.safe_load(front_matter_raw.strip())
-            if front_matter is None:
-                front_matter = {}
-        except yaml.YAMLError as e:
-            raise ParseError(f"Invalid YAML syntax: {e}", filepath) from e
+    # Find the closing delimiter directly instead of splitting: split would
+    # copy the whole body into a throwaway list, and would also stop at a
+    # '---' that merely appears inside a front matter value.
+    end = content.find("\n---", 3)
+    if end == -1:
+        raise ParseError(
+            "Malformed YAML front matter (missing closing '---')", filepath
+        )
 
-        return front_matter, markdown_body.strip()
+    front_matter_raw = content[3:end]
+    markdown_body = content[end + 4 :]
 
+    try:
+        front_matter = yaml.load(front_matter_raw, Loader=_SafeLoader)
+    except yaml.YAMLError as e:
+        raise ParseError(f"Invalid YAML syntax: {e}", filepath) from e
     except Exception as e:
-        if isinstance(e, ParseError):
-            raise
         raise ParseError(f"Failed to parse front matter: {e}", filepath) from e
 
+    if front_matter is None:
+        front_matter = {}
+
+    return front_matter, markdown_body.strip()
+
 
 def validate_front_matter(front_matter: dict[str, Any], filepath: Path) -> None:
     """
@@ -194,6 +258,15 @@ def parse_date(
         return naive_dt.replace(tzinfo=tz)
 
     if isinstance(date_value, str):
+        stripped = date_value.strip()
+        if _ISO_DATE.fullmatch(stripped):
+            try:
+                return datetime.fromisoformat(stripped).replace(tzinfo=tz)
+            except ValueError:
+                # Well-formed but out of range (e.g. month 13); the strptime
+                # loop below rejects it with the usual error.
+                pass
+
         # Try common date formats
         formats = [
             "%Y-%m-%d",  # 2025-10-17
@@ -203,7 +276,7 @@ def parse_date(
 
         for fmt in formats:
             try:
-                naive_dt = datetime.strptime(date_value.strip(), fmt)
+                naive_dt = datetime.strptime(stripped, fmt)
                 return naive_dt.replace(tzinfo=tz)
             except ValueError:
                 continue
@@ -217,10 +290,14 @@ def parse_date(
     )
 
 
+@lru_cache(maxsize=4096)
 def generate_slug(title: str) -> str:
     """
     Generate URL-safe slug from title.
 
+    The result depends only on the title, so it is memoized; repeated titles
+    (and rebuilds within one process) skip the normalization passes.
+
     Args:
         title: Post title
 
@@ -232,14 +309,18 @@ def generate_slug(title: str) -> str:
 
     title = title.strip()
 
+    if title.isascii():
+        # NFKD and the ASCII fold are no-ops here, and the Unicode pass below
+        # would produce the same result, so a single translate pass suffices.
+        slug = _SLUG_DASH.sub("-", title.lower().translate(_ASCII_SLUG_STRIP))
+        return slug.strip("-") or _hash_slug(title)
+
     # First try: normalize Unicode and convert accented chars to ASCII equivalents
     normalized = unicodedata.normalize("NFKD", title)
     ascii_title = normalized.encode("ascii", "ignore").decode("ascii")
 
     # Convert to lowercase and replace spaces/special chars with hyphens
-    slug = re.sub(r"[^\w\s-]", "", ascii_title.lower())
-    slug = re.sub(r"[-\s]+", "-", slug)
-    slug = slug.strip("-")
+    slug = _SLUG_DASH.sub("-", _SLUG_STRIP.sub("", ascii_title.lower())).strip("-")
 
     # If we got a reasonable slug, use it
     if slug and len(slug) >= 3:
@@ -247,14 +328,16 @@ def generate_slug(title: str) -> str:
 
     # Second try: preserve Unicode letters but still clean up
     # This handles scripts like Japanese, Chinese, Arabic, etc.
-    unicode_slug = re.sub(r"[^\w\s-]", "", title.lower())
-    unicode_slug = re.sub(r"[-\s]+", "-", unicode_slug)
-    unicode_slug = unicode_slug.strip("-")
+    unicode_slug = _SLUG_DASH.sub("-", _SLUG_STRIP.sub("", title.lower())).strip("-")
 
     if unicode_slug and len(unicode_slug) >= 1:
         return unicode_slug
 
-    # Final fallback: deterministic hash-based slug to avoid collisions.
+    return _hash_slug(title)
+
+
+def _hash_slug(title: str) -> str:
+    """Final fallback: deterministic hash-based slug to avoid collisions."""
     slug_hash = hashlib.sha1(title.encode("utf-8")).hexdigest()[:8]
     return f"post-{slug_hash}"
 
@@ -280,6 +363,58 @@ def sanitize_html(html_content: str) -> str:
     return sanitized
 
 
+@lru_cache(maxsize=4)
+def _get_markdown(extensions: tuple[str, ...]) -> markdown.Markdown:
+    """
+    Return a shared Markdown converter for the given extensions.
+
+    Building a converter loads every extension (codehilite pulls in Pygments),
+    which costs far more than converting a typical post. Callers must reset()
+    the instance before each document. Not thread-safe; worker processes each
+    get their own cache.
+    """
+    return markdown.Markdown(extensions=list(extensions))
+
+
+@lru_cache(maxsize=1)
+def _pygments_version() -> str | None:
+    """Version of the installed Pygments, or None if it is missing."""
+    try:
+        return importlib.metadata.version("pygments")
+    except importlib.metadata.PackageNotFoundError:
+        return None
+
+
+def parser_versions(markdown_extensions: list[str] | None) -> list[str | None]:
+    """
+    Versions of the code that turns Markdown into HTML.
+
+    These are this package and Markdown, plus Pygments when codehilite
+    highlights code blocks. Every cache of parsed output folds them into its
+    key so an upgrade that changes the HTML never serves older entries.
+
+    Args:
+        markdown_extensions: Extensions in use; None means the defaults
+
+    Returns:
+        Version strings, None for a library that is not installed
+    """
+    versions: list[str | None] = [__version__, markdown.__version__]
+    if markdown_extensions is None or any(
+        "codehilite" in extension for extension in markdown_extensions
+    ):
+        versions.append(_pygments_version())
+    return versions
+
+
+def _parse_cache_salt(markdown_extensions: list[str] | None, timezone: str) -> bytes:
+    """Encode every parse input besides the file bytes, for the cache key."""
+    versions = parser_versions(markdown_extensions)
+    return repr((markdown_extensions, timezone, versions, _PARSED_LAYOUT)).encode(
+        "utf-8"
+    )
+
+
 def _extract_optional_fields(
     front_matter: dict[str, Any], filepath: Path
 ) -> tuple[list[str], bool, str | None]:
@@ -315,6 +450,7 @@ def parse_content_file(
     filepath: Path,
     markdown_extensions: list[str] | None = None,
     timezone: str = "UTC",
+    render_drafts: bool = True,
 ) -> ParsedContent:
     """
     Parse a Markdown file with YAML front matter.
@@ -324,6 +460,8 @@ def parse_content_file(
         markdown_extensions: List of markdown extensions to use
             (defaults to ["extra", "codehilite", "toc"])
         timezone: IANA timezone name for date parsing (defaults to UTC)
+        render_drafts: When False, a draft's front matter is still validated
+            but its body is not converted and content is left empty
 
     Returns:
         ParsedContent object with metadata and content
@@ -334,15 +472,38 @@ def parse_content_file(
     """
     try:
         # Read file content
-        raw_content = filepath.read_text(encoding="utf-8")
+        raw_bytes = filepath.read_bytes()
     except FileNotFoundError:
         # Re-raise FileNotFoundError as-is for proper test handling
         raise
-    except UnicodeDecodeError as e:
-        raise ParseError(f"File encoding error: {e}", filepath) from e
     except Exception as e:
         raise ParseError(f"Failed to read file: {e}", filepath) from e
 
+    return _parse_text(
+        _decode(raw_bytes, filepath),
+        filepath,
+        markdown_extensions,
+        timezone,
+        render_drafts,
+    )
+
+
+def _decode(raw_bytes: bytes, filepath: Path) -> str:
+    """Decode file bytes as UTF-8, reporting failures as ParseError."""
+    try:
+        return raw_bytes.decode("utf-8")
+    except UnicodeDecodeError as e:
+        raise ParseError(f"File encoding error: {e}", filepath) from e
+
+
+def _parse_text(
+    raw_content: str,
+    filepath: Path,
+    markdown_extensions: list[str] | None,
+    timezone: str,
+    render_drafts: bool = True,
+) -> ParsedContent:
+    """Parse already-read file content; see parse_content_file."""
     # Extract front matter and markdown body
     front_matter, markdown_body = extract_front_matter(raw_content, filepath)
 
@@ -360,11 +521,14 @@ def parse_content_file(
     # Extract and validate optional fields
     tags, draft, description = _extract_optional_fields(front_matter, filepath)
 
-    # Convert Markdown to HTML using configured extensions
-    md = markdown.Markdown(
-        extensions=markdown_extensions or ["extra", "codehilite", "toc"]
-    )
-    html_content = sanitize_html(md.convert(markdown_body))
+    # Convert Markdown to HTML using configured extensions; a draft that will
+    # not be published skips the conversion, the bulk of the parse cost.
+    if draft and not render_drafts:
+        html_content = ""
+    else:
+        md = _get_markdown(tuple(markdown_extensions or ["extra", "codehilite", "toc"]))
+        md.reset()
+        html_content = sanitize_html(md.convert(markdown_body))
 
     metadata = ContentMetadata(
         title=front_matter["title"].strip(),
@@ -378,6 +542,91 @@ def parse_content_file(
     return ParsedContent(
         metadata=metadata,
         content=html_content,
-        raw_content=raw_content,
         filepath=filepath,
     )
+
+
+def parse_content_file_cached(
+    filepath: Path,
+    cache_dir: Path,
+    markdown_extensions: list[str] | None = None,
+    timezone: str = "UTC",
+    render_drafts: bool = True,
+) -> ParsedContent:
+    """
+    Parse a content file, reusing a previous result if its inputs are unchanged.
+
+    Results are pickled into cache_dir under a SHA-256 digest of the raw file
+    bytes, the parse options, and the versions of the code doing the parsing.
+    Keying on content rather than mtime means an edit always invalidates the
+    entry, while touching or re-checking out a file does not. Unreadable or
+    stale cache entries are treated as misses. A hit refreshes the entry's
+    mtime, which is how prune_cache_dir tells entries still in use apart.
+
+    Args:
+        filepath: Path to the content file
+        cache_dir: Existing directory holding cached parse results
+        markdown_extensions: List of markdown extensions to use
+        timezone: IANA timezone name for date parsing (defaults to UTC)
+        render_drafts: Passed through to parse_content_file; drafts parsed
+            without their body are not cached
+
+    Returns:
+        ParsedContent object with metadata and content
+
+    Raises:
+        ParseError: If file cannot be parsed
+        FileNotFoundError: If file does not exist
+    """
+    try:
+        raw_bytes = filepath.read_bytes()
+    except FileNotFoundError:
+        raise
+    except OSError as e:
+        raise ParseError(f"Failed to read file: {e}", filepath) from e
+
+    digest = hashlib.sha256(raw_bytes)
+    digest.update(_parse_cache_salt(markdown_extensions, timezone))
+    cache_path = cache_dir / f"{digest.hexdigest()}.pkl"
+
+    try:
+        with open(cache_path, "rb") as f:
+            cached = pickle.load(f)
+    except FileNotFoundError:
+        cached = None
+    except Exception:  # pylint: disable=broad-exception-caught
+        # Corrupt or written by an incompatible version -- just re-parse.
+        # Unpickling foreign data can raise nearly anything, e.g. ValueError
+        # for an unknown protocol or ImportError for a missing module.
+        cached = None
+
+    if isinstance(cached, ParsedContent):
+        try:
+            os.utime(cache_path)
+        except OSError:
+            pass
+        # Identical bytes may live at another path; report the one asked for.
+        cached.filepath = filepath
+        return cached
+
+    parsed = _parse_text(
+        _decode(raw_bytes, filepath),
+        filepath,
+        markdown_extensions,
+        timezone,
+        render_drafts,
+    )
+    if parsed.metadata.draft and not render_drafts:
+        return parsed
+
+    # Write-then-rename so concurrent workers never observe a partial entry.
+    tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            pickle.dump(parsed, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # The cache is an optimization; a failed write must not fail the build.
+        tmp_path.unlink(missing_ok=True)
+
+    return parsed
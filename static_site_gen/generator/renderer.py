@@ -7,13 +7,65 @@ Provides clean separation between content and presentation layers.
 
 from __future__ import annotations
 
+import dataclasses
+import datetime as dt
+import hashlib
+import json
+import os
+from collections.abc import Iterator
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-from jinja2 import Environment, FileSystemLoader, TemplateNotFound
+import jinja2
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    Template,
+    TemplateNotFound,
+)
+
+from . import __version__
+from .output import write_file
 
 if TYPE_CHECKING:
-    from .core import SiteConfig
+    from .config import SiteConfig
+
+
+@lru_cache(maxsize=8)
+def _build_env(template_dir: str, bytecode_cache_dir: str | None) -> Environment:
+    """
+    Return the Jinja2 environment for a template directory.
+
+    Environments are shared by every renderer for the same directory, so
+    repeated builds in one process (watch loops, test suites) reuse
+    templates already compiled in memory. Jinja2's auto_reload checks each
+    template's mtime on lookup, so edited templates are still recompiled.
+
+    Args:
+        template_dir: Resolved template directory path
+        bytecode_cache_dir: Directory for persisted bytecode, or None
+
+    Returns:
+        Configured Environment
+    """
+    return Environment(
+        loader=FileSystemLoader(template_dir),
+        autoescape=True,  # Security: auto-escape HTML
+        trim_blocks=True,  # Clean whitespace handling
+        lstrip_blocks=True,
+        # Left on deliberately: the environment outlives a single build, and
+        # the up-to-date check is what picks up template edits between builds.
+        # Within a build each renderer resolves a template only once, so the
+        # check costs one stat per template, not one per rendered page.
+        auto_reload=True,
+        bytecode_cache=(
+            FileSystemBytecodeCache(bytecode_cache_dir)
+            if bytecode_cache_dir is not None
+            else None
+        ),
+    )
 
 
 class TemplateRenderer:
@@ -25,12 +77,14 @@ class TemplateRenderer:
     built-in extends mechanism.
     """
 
-    def __init__(self, template_dir: Path):
+    def __init__(self, template_dir: Path, bytecode_cache_dir: Path | None = None):
         """
         Initialize renderer with template directory.
 
         Args:
             template_dir: Path to directory containing Jinja2 templates
+            bytecode_cache_dir: Existing directory in which to persist compiled
+                template bytecode between runs, or None to compile in memory only
 
         Raises:
             FileNotFoundError: If template directory doesn't exist
@@ -39,17 +93,22 @@ class TemplateRenderer:
             raise FileNotFoundError(f"Template directory not found: {template_dir}")
 
         self.template_dir = template_dir
-        self.env = Environment(
-            loader=FileSystemLoader(str(template_dir)),
-            autoescape=True,  # Security: auto-escape HTML
-            trim_blocks=True,  # Clean whitespace handling
-            lstrip_blocks=True,
+        self.bytecode_cache_dir = bytecode_cache_dir
+        self.env = _build_env(
+            str(template_dir.resolve()),
+            str(bytecode_cache_dir) if bytecode_cache_dir is not None else None,
         )
+        self._templates: dict[str, Template] = {}
+        self._available_templates: list[str] | None = None
 
     def render_template(self, template_name: str, context: dict[str, Any]) -> str:
         """
         Render template with given context data.
 
+        Each template is looked up once per renderer and then reused, so the
+        many renders of a build skip the environment's cache lookup and
+        auto-reload stat. A build creates a fresh renderer, which sees edits.
+
         Args:
             template_name: Name of template file (e.g., 'post.html')
             context: Dictionary of variables to pass to template
@@ -61,8 +120,11 @@ class TemplateRenderer:
             TemplateNotFound: If template file doesn't exist
         """
         try:
-            template = self.env.get_template(template_name)
-            return template.render(**context)
+            template = self._templates.get(template_name)
+            if template is None:
+                template = self.env.get_template(template_name)
+                self._templates[template_name] = template
+            return template.render(context)
         except TemplateNotFound as e:
             raise TemplateNotFound(
                 f"Template '{template_name}' not found in {self.template_dir}"
@@ -137,6 +199,25 @@ class TemplateRenderer:
         }
         return self.render_template("tag.html", context)
 
+    def render_tag_pages(
+        self, posts_by_tag: dict[str, list[dict[str, Any]]], site_config: SiteConfig
+    ) -> Iterator[tuple[str, str]]:
+        """
+        Render every tag archive page from one template lookup.
+
+        The build renders tag pages concurrently through render_tag_page;
+        this is the serial equivalent for callers that want them all.
+
+        Args:
+            posts_by_tag: Mapping of tag name to posts with that tag
+            site_config: Site-wide configuration data
+
+        Yields:
+            (tag, rendered HTML) pairs in posts_by_tag order
+        """
+        for tag, posts in posts_by_tag.items():
+            yield tag, self.render_tag_page(tag, posts, site_config)
+
     def render_tag_index(
         self,
         tags: list[tuple[str, int]],
@@ -232,7 +313,142 @@ class TemplateRenderer:
         """
         Get list of available template files.
 
+        The directory is scanned once per renderer, like template lookups.
+
         Returns:
             List of template filenames in template directory
         """
-        return [f.name for f in self.template_dir.iterdir() if f.is_file()]
+        if self._available_templates is None:
+            with os.scandir(self.template_dir) as entries:
+                self._available_templates = [
+                    entry.name for entry in entries if entry.is_file()
+                ]
+        return list(self._available_templates)
+
+
+def _cache_key_default(value: Any) -> Any:
+    """
+    JSON-encode the non-JSON values that reach render methods.
+
+    Raises:
+        TypeError: For any other value, so it is not keyed by its repr
+    """
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    if isinstance(value, (dt.date, dt.time)):
+        return value.isoformat()
+    if isinstance(value, Path):
+        return str(value)
+    raise TypeError(f"Cannot key a {type(value).__name__}")
+
+
+def renderer_versions() -> tuple[str, str]:
+    """
+    Versions of the code that turns templates into pages.
+
+    Every cache of rendered output folds these into its key so a Jinja2
+    upgrade never serves pages rendered by the old version.
+    """
+    return (__version__, jinja2.__version__)
+
+
+class RenderCache:
+    """
+    On-disk cache of rendered pages, keyed on everything that shapes them.
+
+    A key is a BLAKE2b digest of the renderer method, its arguments, and a
+    signature of every file under the template directory, so an edit to a
+    post, the config, or any template (including ones only reached through
+    extends or include) changes the key. Unreadable entries are misses, and
+    a hit refreshes the entry's mtime so prune_cache_dir keeps it.
+    """
+
+    def __init__(self, cache_dir: Path, template_dir: Path):
+        """
+        Initialize cache for one template directory.
+
+        Args:
+            cache_dir: Existing directory holding cached pages
+            template_dir: Template directory whose files are fingerprinted
+        """
+        self.cache_dir = cache_dir
+        signature = []
+        for root, _, files in os.walk(template_dir):
+            for name in files:
+                st = os.stat(os.path.join(root, name))
+                relpath = os.path.relpath(os.path.join(root, name), template_dir)
+                signature.append((relpath, st.st_size, st.st_mtime_ns))
+        self._salt = (renderer_versions(), sorted(signature))
+        # Listed posts keyed by id, with the dict itself kept alive so the id
+        # cannot be reused while this cache exists.
+        self._listed: dict[int, tuple[dict[str, Any], dict[str, Any]]] = {}
+
+    def _listed_item(self, post: Any) -> Any:
+        """
+        Return a listed post with its body replaced by a digest of the body.
+
+        A post appears on every tag page it is tagged with, so its HTML is
+        hashed once here rather than serialized again for each page's key.
+        Anything other than a post dict is returned unchanged.
+        """
+        if not isinstance(post, dict) or not isinstance(post.get("content"), str):
+            return post
+        entry = self._listed.get(id(post))
+        if entry is None or entry[0] is not post:
+            body = post["content"]
+            digest = hashlib.blake2b(
+                body.encode("utf-8", "surrogatepass"), digest_size=16
+            ).hexdigest()
+            entry = (post, {**post, "content": digest})
+            self._listed[id(post)] = entry
+        return entry[1]
+
+    def key(self, method: str, args: tuple[Any, ...]) -> str | None:
+        """
+        Compute the cache key for one render call.
+
+        Args:
+            method: TemplateRenderer method name, e.g. "render_post"
+            args: Positional arguments for that method
+
+        Returns:
+            Hex digest, or None if the arguments cannot be serialized
+        """
+        # Posts inside list arguments are listings (tag pages); their bodies
+        # go in as per-post digests. A page's own post stays in full.
+        args = tuple(
+            [self._listed_item(item) for item in arg] if isinstance(arg, list) else arg
+            for arg in args
+        )
+        # Canonical JSON depends only on values. Pickle also encodes object
+        # identity, so equal posts differing only in string interning (fresh
+        # parses versus parse cache hits) would get different keys.
+        try:
+            payload = json.dumps(
+                [self._salt, method, args],
+                sort_keys=True,
+                default=_cache_key_default,
+                ensure_ascii=False,
+            )
+        except (TypeError, ValueError):
+            return None
+        return hashlib.blake2b(
+            payload.encode("utf-8", "surrogatepass"), digest_size=16
+        ).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        """Return the cached page for key, or None on a miss."""
+        path = self.cache_dir / f"{key}.html"
+        try:
+            content = path.read_bytes().decode("utf-8")
+            os.utime(path)
+        except (OSError, UnicodeDecodeError):
+            return None
+        return content
+
+    def put(self, key: str, content: str) -> None:
+        """Store a rendered page; failures only cost a later re-render."""
+        try:
+            write_file(self.cache_dir / f"{key}.html", content, assume_dir_exists=True)
+        except OSError:
+            pass
@@ -0,0 +1,92 @@
+"""
+Worker-process entry points for parallel parsing and rendering.
+
+Executors pickle these functions by reference, so they live at module level
+and import their heavy dependencies lazily inside each worker.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .parser import ParsedContent
+    from .renderer import TemplateRenderer
+
+
+def parse_one(
+    filepath: Path,
+    extensions: list[str],
+    timezone: str,
+    cache_dir: Path | None,
+    render_drafts: bool = True,
+) -> tuple[Path, ParsedContent | Exception]:
+    """
+    Parse a single content file, returning expected errors instead of raising.
+
+    Runs inside worker processes, so it must stay importable at module level.
+    Returning the exception lets one bad file be reported without tearing
+    down the whole pool.
+
+    Args:
+        filepath: Markdown file to parse
+        extensions: Markdown extensions to enable
+        timezone: IANA timezone name for date parsing
+        cache_dir: Parse cache directory, or None to always parse
+        render_drafts: Convert the body of draft files too
+
+    Returns:
+        Tuple of (filepath, ParsedContent or the exception that was raised)
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from .parser import ParseError, parse_content_file, parse_content_file_cached
+
+    try:
+        if cache_dir is None:
+            return filepath, parse_content_file(
+                filepath, extensions, timezone, render_drafts
+            )
+        return filepath, parse_content_file_cached(
+            filepath, cache_dir, extensions, timezone, render_drafts
+        )
+    except (ParseError, OSError, ValueError) as e:
+        return filepath, e
+
+
+@lru_cache(maxsize=1)
+def _worker_renderer(
+    template_dir: Path, bytecode_cache_dir: Path | None
+) -> TemplateRenderer:
+    """Return this worker process's renderer, created on its first task."""
+    # pylint: disable-next=import-outside-toplevel
+    from .renderer import TemplateRenderer
+
+    return TemplateRenderer(template_dir, bytecode_cache_dir)
+
+
+def render_one(
+    template_dir: Path,
+    bytecode_cache_dir: Path | None,
+    method: str,
+    args: tuple[Any, ...],
+) -> str | Exception:
+    """
+    Render one page in a worker process, returning expected errors.
+
+    Args:
+        template_dir: Template directory for the worker's renderer
+        bytecode_cache_dir: Shared bytecode cache, so workers load compiled
+            templates instead of each compiling them from source
+        method: TemplateRenderer method to call, e.g. "render_post"
+        args: Positional arguments for that method
+
+    Returns:
+        Rendered content, or the OSError or ValueError that was raised
+    """
+    renderer = _worker_renderer(template_dir, bytecode_cache_dir)
+    try:
+        return str(getattr(renderer, method)(*args))
+    except (OSError, ValueError) as e:
+        return e
@@ -5,6 +5,8 @@ These tests cover all CLI functionality including build command,
 initialization, error handling, and argument parsing.
 """
 
+import subprocess
+import sys
 import tempfile
 from io import StringIO
 from pathlib import Path
@@ -12,7 +14,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from static_site_gen.cli import cmd_build, cmd_init, main
+from static_site_gen.cli import cmd_build, cmd_init, create_parser, main
 
 
 class TestCLI:
@@ -31,6 +33,68 @@ class TestCLI:
         output = mock_stdout.getvalue()
         assert "usage:" in output.lower()
 
+    def test_top_level_help_lists_every_command(self):
+        """Test that top-level help still lists all subcommands."""
+        with (
+            patch("sys.argv", ["cli.py", "--help"]),
+            patch("sys.stdout", new_callable=StringIO) as mock_stdout,
+            pytest.raises(SystemExit),
+        ):
+            main()
+
+        assert "{build,init,serve}" in mock_stdout.getvalue()
+
+    def test_create_parser_registers_only_requested_command(self):
+        """Test that naming a subcommand builds only that subparser."""
+        parser = create_parser("init")
+
+        assert parser.parse_args(["init", "blog"]).project_name == "blog"
+        with (
+            patch("sys.stderr", new_callable=StringIO),
+            pytest.raises(SystemExit),
+        ):
+            parser.parse_args(["build"])
+
+    def test_main_with_version_flag(self):
+        """Test that --version prints the package version."""
+        with (
+            patch("sys.argv", ["cli.py", "--version"]),
+            patch("sys.stdout", new_callable=StringIO) as mock_stdout,
+        ):
+            exit_code = main()
+
+        assert exit_code == 0
+        assert mock_stdout.getvalue().startswith("static-site-gen ")
+
+    def test_importing_cli_does_not_load_build_dependencies(self):
+        """Test that the CLI defers Jinja2, Markdown, and PyYAML until build."""
+        code = (
+            "import sys, static_site_gen.cli; "
+            "print(sorted({'jinja2', 'markdown', 'yaml'} & set(sys.modules)))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert result.stdout.strip() == "[]"
+
+    def test_importing_package_defers_generator_core(self):
+        """Test that SiteGenerator is imported on first attribute access."""
+        code = (
+            "import sys, static_site_gen; "
+            "print('static_site_gen.generator.core' in sys.modules); "
+            "print(static_site_gen.SiteGenerator.__name__)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert result.stdout.split() == ["False", "SiteGenerator"]
+
     def test_main_with_build_command(self):
         """Test main function with build command."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -132,6 +196,9 @@ author: "Test Author"
 
             args = Mock()
             args.project_dir = str(temp_path)
+            args.jobs = 0
+            args.drafts = False
+            args.force = False
 
             exit_code = cmd_build(args)
 
@@ -145,6 +212,9 @@ author: "Test Author"
 
             args = Mock()
             args.project_dir = str(temp_path)
+            args.jobs = 0
+            args.drafts = False
+            args.force = False
 
             exit_code = cmd_build(args)
             assert exit_code == 1
@@ -162,6 +232,9 @@ invalid: yaml: structure::
 
             args = Mock()
             args.project_dir = str(temp_path)
+            args.jobs = 0
+            args.drafts = False
+            args.force = False
 
             exit_code = cmd_build(args)
             assert exit_code == 1
@@ -181,6 +254,9 @@ author: "Test Author"
 
             args = Mock()
             args.project_dir = str(temp_path)
+            args.jobs = 0
+            args.drafts = False
+            args.force = False
 
             exit_code = cmd_build(args)
             assert exit_code == 1
@@ -227,6 +303,19 @@ author: "Test Author"
         config_text = (project / "config.yaml").read_text()
         assert str(project) in config_text
 
+    def test_init_writes_scaffold_without_leftover_temp_files(self, tmp_path):
+        """Test that init writes files byte-for-byte with no .tmp siblings."""
+        project = tmp_path / "my-blog"
+        args = Mock()
+        args.project_name = str(project)
+
+        cmd_init(args)
+
+        style = (project / "static" / "style.css").read_bytes()
+        assert style.startswith(b"/* Basic reset")
+        assert b"\r\n" not in style
+        assert not list(project.rglob("*.tmp"))
+
     def test_error_handling_in_main(self):
         """Test error handling in main function."""
         with patch("sys.argv", ["cli.py", "build", "--project-dir", "/nonexistent"]):
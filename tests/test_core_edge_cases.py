@@ -6,6 +6,8 @@ configuration loading, and error handling scenarios.
 """
 
 # pylint: disable=protected-access
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock
 
 import pytest
@@ -127,6 +129,134 @@ This is published.
         assert len(published_posts) == 1
         assert published_posts[0].metadata.title == "Published Post"
 
+    def test_process_content_parallel_skips_invalid_and_keeps_order(self, tmp_path):
+        """Test that pooled parsing skips bad files and preserves input order."""
+        generator = self._create_project_structure(tmp_path)
+
+        content_dir = tmp_path / "content" / "posts"
+        content_dir.mkdir(parents=True)
+
+        files = []
+        for i in range(6):
+            post_file = content_dir / f"2023-01-0{i + 1}-post.md"
+            if i == 2:
+                post_file.write_text("No front matter here.")
+            else:
+                post_file.write_text(
+                    f"---\ntitle: Same Title\ndate: 2023-01-0{i + 1}\n---\n\nBody {i}\n"
+                )
+            files.append(post_file)
+
+        result = generator.process_content({"posts": files, "pages": []})
+
+        assert [post.filepath for post in result["posts"]] == [
+            f for i, f in enumerate(files) if i != 2
+        ]
+        assert [post.metadata.slug for post in result["posts"]] == [
+            "same-title",
+            "same-title-2",
+            "same-title-3",
+            "same-title-4",
+            "same-title-5",
+        ]
+
+    def test_process_content_reports_errors_in_one_summary(self, tmp_path, caplog):
+        """Test that parse failures are logged as a single summary record."""
+        generator = self._create_project_structure(tmp_path)
+
+        content_dir = tmp_path / "content" / "posts"
+        content_dir.mkdir(parents=True)
+        bad_files = [content_dir / "bad-1.md", content_dir / "bad-2.md"]
+        for bad_file in bad_files:
+            bad_file.write_text("No front matter here.")
+
+        with caplog.at_level(logging.ERROR):
+            generator.process_content({"posts": bad_files, "pages": []})
+
+        assert len(caplog.records) == 1
+        message = caplog.records[0].getMessage()
+        assert message.startswith("Error processing 2 post file(s):")
+        assert all(str(bad_file) in message for bad_file in bad_files)
+
+    def test_jobs_one_parses_without_a_process_pool(self, tmp_path, monkeypatch):
+        """Test that jobs=1 parses serially even above the pool threshold."""
+        generator = SiteGenerator(tmp_path, jobs=1)
+        generator.config = Mock(timezone="UTC", markdown_extensions=["extra"])
+
+        content_dir = tmp_path / "content" / "posts"
+        content_dir.mkdir(parents=True)
+        files = []
+        for i in range(6):
+            post_file = content_dir / f"2023-01-0{i + 1}-post.md"
+            post_file.write_text(f"---\ntitle: Post {i}\ndate: 2023-01-01\n---\n")
+            files.append(post_file)
+
+        def no_pool(*args, **kwargs):
+            raise AssertionError("process pool should not be used")
+
+        monkeypatch.setattr(
+            "static_site_gen.generator.core.ProcessPoolExecutor", no_pool
+        )
+        result = generator.process_content({"posts": files, "pages": []})
+
+        assert len(result["posts"]) == 6
+
+    def test_single_cpu_parses_without_a_process_pool(self, tmp_path, monkeypatch):
+        """Test that jobs=0 on a one-CPU machine parses serially."""
+        generator = SiteGenerator(tmp_path, jobs=0)
+        generator.config = Mock(timezone="UTC", markdown_extensions=["extra"])
+
+        content_dir = tmp_path / "content" / "posts"
+        content_dir.mkdir(parents=True)
+        files = []
+        for i in range(6):
+            post_file = content_dir / f"2023-01-0{i + 1}-post.md"
+            post_file.write_text(f"---\ntitle: Post {i}\ndate: 2023-01-01\n---\n")
+            files.append(post_file)
+
+        def no_pool(*args, **kwargs):
+            raise AssertionError("process pool should not be used")
+
+        monkeypatch.setattr("static_site_gen.generator.core.os.cpu_count", lambda: 1)
+        monkeypatch.setattr(
+            "static_site_gen.generator.core.ProcessPoolExecutor", no_pool
+        )
+        result = generator.process_content({"posts": files, "pages": []})
+
+        assert len(result["posts"]) == 6
+
+    def test_parse_pool_not_larger_than_file_count(self, tmp_path, monkeypatch):
+        """Test that the parse pool starts no more workers than files."""
+        generator = SiteGenerator(tmp_path, jobs=16)
+        generator.config = Mock(timezone="UTC", markdown_extensions=["extra"])
+
+        content_dir = tmp_path / "content" / "posts"
+        content_dir.mkdir(parents=True)
+        files = []
+        for i in range(5):
+            post_file = content_dir / f"2023-01-0{i + 1}-post.md"
+            post_file.write_text(f"---\ntitle: Post {i}\ndate: 2023-01-01\n---\n")
+            files.append(post_file)
+
+        pool_sizes = []
+
+        def thread_pool(max_workers):
+            pool_sizes.append(max_workers)
+            return ThreadPoolExecutor(max_workers=max_workers)
+
+        monkeypatch.setattr(
+            "static_site_gen.generator.core.ProcessPoolExecutor", thread_pool
+        )
+        result = generator.process_content({"posts": files, "pages": []})
+
+        assert pool_sizes == [5]
+        assert len(result["posts"]) == 5
+
+    def test_negative_jobs_rejected(self, tmp_path):
+        """Test that a negative worker count is rejected."""
+        with pytest.raises(ValueError, match="jobs must be 0 or greater"):
+            SiteGenerator(tmp_path, jobs=-1)
+
     def test_build_error_handling_scenarios(self, tmp_path):
         """Test various error scenarios during build."""
         generator = self._create_project_structure(tmp_path)
@@ -208,6 +338,21 @@ This is published.
         result = generator._resolve_slug_collision("test-post", generator.used_slugs)
         assert result == "test-post-5"
 
+    def test_resolve_slug_collision_resumes_from_counter(self, tmp_path):
+        """Test that a shared counter map skips suffixes already handed out."""
+        generator = self._create_project_structure(tmp_path)
+        slugs = {"post"}
+        next_counter: dict[str, int] = {}
+
+        resolved = []
+        for _ in range(3):
+            slug = generator._resolve_slug_collision("post", slugs, next_counter)
+            slugs.add(slug)
+            resolved.append(slug)
+
+        assert resolved == ["post-2", "post-3", "post-4"]
+        assert next_counter == {"post": 5}
+
     def test_config_missing_file_raises(self, tmp_path):
         """Test that loading from a nonexistent path raises FileNotFoundError."""
         generator = SiteGenerator(tmp_path / "nonexistent")
@@ -228,6 +373,47 @@ base_url: "https://example.com"
         with pytest.raises(yaml.YAMLError):
             generator.load_config()
 
+    def test_config_decodes_utf8_with_bom(self, tmp_path):
+        """Test that config bytes are decoded as UTF-8, BOM or not."""
+        (tmp_path / "config.yaml").write_bytes(
+            '\ufeffsite_name: "Café Notes"\n'
+            'base_url: "https://example.com"\n'
+            'author: "Zoë"\n'.encode("utf-8")
+        )
+
+        config = SiteGenerator(tmp_path).load_config()
+
+        assert config.site_name == "Café Notes"
+        assert config.author == "Zoë"
+
+    def test_config_parse_is_cached_on_file_contents(self, tmp_path, monkeypatch):
+        """Test that unchanged config is parsed once and edits are seen."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(
+            'site_name: "Cached"\nbase_url: "https://example.com"\nauthor: "A"\n'
+        )
+        loads = []
+        real_load = yaml.load
+
+        def counting_load(*args, **kwargs):
+            loads.append(args)
+            return real_load(*args, **kwargs)
+
+        monkeypatch.setattr(yaml, "load", counting_load)
+
+        first = SiteGenerator(tmp_path).load_config()
+        first.keywords.append("mutated")
+        second = SiteGenerator(tmp_path).load_config()
+        assert len(loads) == 1
+        assert second is not first
+        assert second.keywords == []
+
+        config_file.write_text(
+            'site_name: "Edited"\nbase_url: "https://example.com"\nauthor: "A"\n'
+        )
+        assert SiteGenerator(tmp_path).load_config().site_name == "Edited"
+        assert len(loads) == 2
+
     def test_config_missing_required_fields_raises(self, tmp_path):
         """Test that missing required fields raises ValueError."""
         (tmp_path / "config.yaml").write_text(
@@ -308,6 +494,19 @@ class TestDiscoverContent:
         filenames = [p.name for p in result["posts"]]
         assert "2025-01-01-real.md" in filenames
 
+    def test_ignores_directories_and_sorts_by_name(self, tmp_path):
+        """Test that only regular .md files are returned, in name order."""
+        generator = self._make_generator(tmp_path)
+        posts_dir = tmp_path / "content" / "posts"
+
+        (posts_dir / "b.md").write_text("# B")
+        (posts_dir / "a.md").write_text("# A")
+        (posts_dir / "drafts.md").mkdir()
+
+        result = generator.discover_content()
+
+        assert [p.name for p in result["posts"]] == ["a.md", "b.md"]
+
     def test_empty_content_directories(self, tmp_path):
         """Test discovery with empty content directories."""
         generator = self._make_generator(tmp_path)
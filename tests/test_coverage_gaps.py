@@ -36,7 +36,9 @@ class TestCLICoverage:
         """Build catches OSError and returns exit code 1."""
         args = Mock()
         args.project_dir = str(tmp_path)
+        args.jobs = 0
         args.drafts = False
+        args.force = False
 
         # Create a config.yaml that will cause an OSError during build
         # by making the output directory unwritable
@@ -290,6 +292,30 @@ class TestRendererCoverage:
         html = renderer.render_index_page([], config, pagination)
         assert "Page 2" in html
 
+    def test_render_tag_pages_yields_each_tag_in_order(self):
+        """render_tag_pages renders every tag with a single template lookup."""
+        from static_site_gen.generator.core import SiteConfig
+        from tests.conftest import PROJECT_ROOT
+
+        renderer = TemplateRenderer(PROJECT_ROOT / "templates")
+        config = SiteConfig(
+            site_name="Test",
+            base_url="https://example.com",
+            author="Test",
+        )
+
+        with patch.object(
+            renderer.env, "get_template", wraps=renderer.env.get_template
+        ) as get_template:
+            pages = list(renderer.render_tag_pages({"b": [], "a": []}, config))
+
+        assert [tag for tag, _ in pages] == ["b", "a"]
+        assert 'Posts tagged "b"' in pages[0][1]
+        tag_lookups = [
+            call for call in get_template.call_args_list if call.args[0] == "tag.html"
+        ]
+        assert len(tag_lookups) == 1
+
 
 # ── Core error-handling paths ─────────────────────────────────────────────
 
@@ -320,6 +346,36 @@ class TestCoreErrorHandling:
             # Should not raise -- error is logged, post is skipped
             generator.generate_posts(posts)
 
+    def test_generate_posts_continues_past_failed_post(self, sample_project):
+        """A failing post is skipped while the others are still written."""
+        posts_dir = sample_project / "content" / "posts"
+        for i in range(5):
+            (posts_dir / f"2025-01-0{i + 1}-post.md").write_text(
+                f"---\ntitle: Post {i}\ndate: 2025-01-0{i + 1}\n---\n\nBody {i}\n"
+            )
+
+        generator = SiteGenerator(sample_project)
+        generator.load_config()
+        generator.renderer = TemplateRenderer(generator.template_dir)
+        generator.output_dir = sample_project / "site"
+        generator.output_dir.mkdir(exist_ok=True)
+        posts = generator._process_content_files(sorted(posts_dir.glob("*.md")), "post")
+
+        real_render_post = generator.renderer.render_post
+
+        def render_post(post_data, site_config):
+            if post_data["slug"] == "post-2":
+                raise ValueError("bad template")
+            return real_render_post(post_data, site_config)
+
+        with patch.object(generator.renderer, "render_post", side_effect=render_post):
+            generator.generate_posts(posts)
+
+        written = sorted(
+            p.parent.name for p in (generator.output_dir / "posts").glob("*/index.html")
+        )
+        assert written == ["post-0", "post-1", "post-3", "post-4"]
+
     def test_generate_tag_pages_logs_render_error(
         self, sample_project, sample_post_content
     ):
@@ -342,6 +398,28 @@ class TestCoreErrorHandling:
         ):
             generator.generate_tag_pages(posts)
 
+    def test_generate_tag_pages_orders_posts_newest_first(self, sample_project):
+        """Each tag page receives its posts newest first from unsorted input."""
+        posts_dir = sample_project / "content" / "posts"
+        for day in (2, 3, 1):
+            (posts_dir / f"2025-01-0{day}-post.md").write_text(
+                f"---\ntitle: Day {day}\ndate: 2025-01-0{day}\ntags: [t]\n---\n"
+            )
+
+        generator = SiteGenerator(sample_project)
+        generator.load_config()
+        generator.renderer = TemplateRenderer(generator.template_dir)
+        generator.output_dir = sample_project / "site"
+        posts = generator._process_content_files(sorted(posts_dir.glob("*.md")), "post")
+
+        with patch.object(
+            generator.renderer, "render_tag_page", return_value="<html></html>"
+        ) as render_tag_page:
+            generator.generate_tag_pages(posts)
+
+        _, tag_posts, _ = render_tag_page.call_args.args
+        assert [p["slug"] for p in tag_posts] == ["day-3", "day-2", "day-1"]
+
     def test_generate_pages_logs_render_error(
         self, sample_project, sample_page_content
     ):
@@ -475,3 +553,157 @@ class TestCoreErrorHandling:
         assert (site_dir / "index.html").exists()
         assert (site_dir / "page" / "2" / "index.html").exists()
         assert (site_dir / "page" / "3" / "index.html").exists()
+
+
+# ── Package, cache, and incremental build coverage ────────────────────────
+
+
+class TestLazyPackageExports:
+    """Cover the package-level lazy attribute hook."""
+
+    def test_site_generator_resolves_and_unknown_names_raise(self):
+        """SiteGenerator resolves lazily; other names raise AttributeError."""
+        import static_site_gen
+
+        assert static_site_gen.SiteGenerator is SiteGenerator
+        with pytest.raises(AttributeError, match="no attribute 'Missing'"):
+            getattr(static_site_gen, "Missing")
+
+
+class TestUnicodeSlugFallbacks:
+    """Cover the non-ASCII slug paths behind the ASCII fast path."""
+
+    def test_non_latin_title_keeps_unicode_letters(self):
+        """Scripts with no ASCII folding keep their letters."""
+        assert generate_slug("日本語 タイトル") == "日本語-タイトル"
+
+    def test_short_ascii_fold_uses_unicode_slug(self):
+        """Accented titles folding to fewer than 3 chars keep the accent."""
+        assert generate_slug("É") == "é"
+
+    def test_symbol_only_unicode_title_hashes(self):
+        """Titles with no letters at all fall back to a hash slug."""
+        assert generate_slug("🎉🎉").startswith("post-")
+
+
+class TestParseCacheCoverage:
+    """Cover parse cache error paths."""
+
+    def test_unreadable_path_raises_parse_error(self, tmp_path):
+        """A path that cannot be read as a file is reported as ParseError."""
+        from static_site_gen.generator.parser import parse_content_file_cached
+
+        with pytest.raises(ParseError, match="Failed to read file"):
+            parse_content_file_cached(tmp_path, tmp_path)
+
+    def test_failed_cache_write_still_returns_result(self, tmp_path):
+        """A cache directory that cannot be written does not fail parsing."""
+        from static_site_gen.generator.parser import parse_content_file_cached
+
+        post = tmp_path / "post.md"
+        post.write_text("---\ntitle: Cached\ndate: 2025-01-01\n---\n\nBody\n")
+
+        parsed = parse_content_file_cached(post, tmp_path / "missing")
+
+        assert parsed.metadata.title == "Cached"
+
+
+class TestIncrementalBuildCoverage:
+    """Cover error and fallback paths of incremental builds."""
+
+    def test_unusable_cache_dir_disables_caches(self, sample_project, caplog):
+        """A cache path that is a file disables caching but still builds."""
+        cache_file = sample_project / "cache-file"
+        cache_file.write_text("")
+
+        SiteGenerator(sample_project, cache_dir=cache_file).build()
+
+        assert "Cache 'jinja' disabled" in caplog.text
+        assert (sample_project / "site" / "static" / "style.css").exists()
+
+    def test_serial_build_runs_tasks_inline(self, sample_project):
+        """jobs=1 renders every page without a thread pool."""
+        (sample_project / "content" / "posts" / "2025-01-01-one.md").write_text(
+            "---\ntitle: One\ndate: 2025-01-01\n---\n\nBody\n"
+        )
+
+        SiteGenerator(sample_project, jobs=1).build()
+
+        assert (sample_project / "site" / "posts" / "one" / "index.html").exists()
+
+    def test_deleted_output_is_rewritten(self, sample_project):
+        """An output removed since the last build is written again."""
+        (sample_project / "content" / "posts" / "2025-01-01-one.md").write_text(
+            "---\ntitle: One\ndate: 2025-01-01\n---\n\nBody\n"
+        )
+        SiteGenerator(sample_project).build()
+        page = sample_project / "site" / "posts" / "one" / "index.html"
+        page.unlink()
+
+        SiteGenerator(sample_project).build()
+
+        assert page.exists()
+
+    def test_manifest_save_failure_is_logged(self, sample_project, caplog):
+        """A manifest that cannot be written only logs a warning."""
+        with patch(
+            "static_site_gen.generator.core.write_output_manifest",
+            side_effect=OSError("disk full"),
+        ):
+            SiteGenerator(sample_project).build()
+
+        assert "Output manifest not saved: disk full" in caplog.text
+
+    def test_manifest_without_object_is_ignored(self, tmp_path):
+        """A manifest that is valid JSON but not an object is a miss."""
+        from static_site_gen.generator.output import read_output_manifest
+
+        manifest = tmp_path / "manifest.json"
+        manifest.write_text("[]")
+
+        assert read_output_manifest(manifest, tmp_path) == {}
+
+    def test_render_requires_renderer(self, tmp_path):
+        """Rendering a batch without a renderer is a programming error."""
+        with pytest.raises(RuntimeError, match="Renderer must be initialized"):
+            SiteGenerator(tmp_path)._render_and_write_all("render_post", [])
+
+    def test_output_dir_failures_are_left_to_the_writer(self, sample_project, caplog):
+        """A page whose directory cannot be created is logged and skipped."""
+        generator = SiteGenerator(sample_project)
+        generator.load_config()
+        generator.renderer = TemplateRenderer(generator.template_dir)
+        generator.output_dir.mkdir()
+        (generator.output_dir / "blocked").write_text("a file, not a directory")
+
+        generator._render_and_write_all(
+            "render_page",
+            [("page 'x'", "/blocked/x/", ({"title": "X"}, generator.config))],
+        )
+
+        assert "Error generating page 'x'" in caplog.text
+
+    def test_cached_page_write_failure_is_logged(self, sample_project, caplog):
+        """A render cache hit that cannot be written is logged and skipped."""
+        generator = SiteGenerator(sample_project)
+        generator.load_config()
+        generator.renderer = TemplateRenderer(generator.template_dir)
+        generator.output_dir.mkdir()
+        items = [("page 'x'", "/x/", ({"title": "X"}, generator.config))]
+        generator._render_and_write_all("render_page", items)
+
+        with patch.object(generator, "_write_output", side_effect=OSError("full")):
+            generator._render_and_write_all("render_page", items)
+
+        assert "Error generating page 'x': full" in caplog.text
+
+    def test_render_cache_put_failure_is_ignored(self, tmp_path):
+        """A cache entry that cannot be stored is silently skipped."""
+        from static_site_gen.generator.renderer import RenderCache
+
+        (tmp_path / "templates").mkdir()
+        cache = RenderCache(tmp_path / "missing", tmp_path / "templates")
+
+        cache.put("key", "<p>page</p>")
+
+        assert cache.get("key") is None
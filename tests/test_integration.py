@@ -7,9 +7,19 @@ static assets, and empty-site edge cases.
 """
 
 # pylint: disable=too-few-public-methods
+import errno
+import os
+import shutil
+import threading
 from pathlib import Path
+from unittest.mock import patch
 
+import pytest
+
+from static_site_gen.generator import core
 from static_site_gen.generator.core import SiteGenerator
+from static_site_gen.generator.output import get_output_path
+from static_site_gen.generator.renderer import TemplateRenderer
 
 
 def _write_post(posts_dir: Path, filename: str, content: str) -> None:
@@ -98,6 +108,46 @@ class TestCompleteBuildPipeline:
         assert "rss-test-post" in feed_xml
         assert "<rss" in feed_xml
 
+    def test_listing_inputs_prepared_once_per_build(self, sample_project):
+        """Test that post dicts are sorted and grouped once for all listings."""
+        posts_dir = sample_project / "content" / "posts"
+        _write_post(
+            posts_dir,
+            "2025-10-17-once.md",
+            '---\ntitle: "Once"\ndate: 2025-10-17\ntags: [a]\n---\n\nBody.\n',
+        )
+
+        with patch.object(
+            SiteGenerator,
+            "prepare_post_dicts",
+            wraps=SiteGenerator.prepare_post_dicts,
+        ) as prepare:
+            site = _build(sample_project)
+
+        assert prepare.call_count == 1
+        assert "Once" in (site / "tag" / "a" / "index.html").read_text()
+        assert "Once" in (site / "feed.xml").read_text()
+
+    def test_output_paths_resolved_once_per_page(self, sample_project):
+        """Test that each rendered page's output path is validated once."""
+        posts_dir = sample_project / "content" / "posts"
+        for slug in ("one", "two"):
+            _write_post(
+                posts_dir,
+                f"2025-10-17-{slug}.md",
+                f'---\ntitle: "{slug}"\ndate: 2025-10-17\ntags: [a]\n---\n\nBody.\n',
+            )
+
+        with patch(
+            "static_site_gen.generator.output.get_output_path",
+            wraps=get_output_path,
+        ) as resolve:
+            site = _build(sample_project)
+
+        url_paths = [call.args[1] for call in resolve.call_args_list]
+        assert sorted(url_paths) == ["/posts/one/", "/posts/two/", "/tag/a/"]
+        assert (site / "posts" / "two" / "index.html").exists()
+
 
 class TestMultiPostOrdering:
     """Tests that multiple posts are listed in correct chronological order."""
@@ -214,6 +264,29 @@ class TestDraftFiltering:
         assert "Visible Post" in feed_xml
         assert "Draft Post" not in feed_xml
 
+    def test_drafts_build_leaves_processed_posts_unsorted(self, sample_project):
+        """Building with drafts does not reorder process_content's result."""
+        posts_dir = sample_project / "content" / "posts"
+        for day in ("01", "02", "03"):
+            _write_post(
+                posts_dir,
+                f"2025-10-{day}-post.md",
+                f'---\ntitle: "Post {day}"\ndate: 2025-10-{day}\n---\n\nBody.\n',
+            )
+        calls = []
+        process_content = SiteGenerator.process_content
+
+        def record(self, *args, **kwargs):
+            result = process_content(self, *args, **kwargs)
+            calls.append((result, [post.metadata.slug for post in result["posts"]]))
+            return result
+
+        with patch.object(SiteGenerator, "process_content", record):
+            SiteGenerator(sample_project).build(include_drafts=True)
+
+        ((processed, order),) = calls
+        assert [post.metadata.slug for post in processed["posts"]] == order
+
 
 class TestTagPages:
     """Tests for tag archive page generation."""
@@ -319,3 +392,361 @@ class TestEmptyBuilds:
         assert not (site / "posts" / "only-draft" / "index.html").exists()
         # Static assets still copied
         assert (site / "static" / "style.css").exists()
+
+
+class TestRebuilds:
+    """Tests for repeated builds of the same project in one process."""
+
+    def test_rebuild_reuses_template_environment(self, sample_project):
+        """A second build shares the first build's Jinja2 environment."""
+        first = SiteGenerator(sample_project)
+        first.build()
+        second = SiteGenerator(sample_project)
+        second.build()
+
+        assert first.renderer is not None and second.renderer is not None
+        assert second.renderer.env is first.renderer.env
+
+    def test_template_edit_is_picked_up(self, sample_project):
+        """Editing a template between builds changes the rendered output."""
+        pages_dir = sample_project / "content" / "pages"
+        _write_page(
+            pages_dir,
+            "about.md",
+            '---\ntitle: "About"\ndate: 2025-10-17\n---\n\nAbout text.\n',
+        )
+        _build(sample_project)
+
+        page_template = sample_project / "templates" / "page.html"
+        page_template.write_text("EDITED {{ page.title }}")
+        stat = page_template.stat()
+        os.utime(page_template, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        site = _build(sample_project)
+
+        assert (site / "about" / "index.html").read_text() == "EDITED About"
+
+    def test_removed_static_dir_clears_copied_assets(self, sample_project):
+        """Assets kept between builds are dropped once the source is gone."""
+        site = _build(sample_project)
+        assert (site / "static" / "style.css").exists()
+
+        shutil.rmtree(sample_project / "static")
+        site = _build(sample_project)
+
+        assert not (site / "static").exists()
+
+    def test_unchanged_outputs_are_not_rewritten(self, sample_project):
+        """Pages whose content did not change keep their file untouched."""
+        posts_dir = sample_project / "content" / "posts"
+        _write_post(
+            posts_dir,
+            "2025-10-17-kept.md",
+            '---\ntitle: "Kept"\ndate: 2025-10-17\n---\n\nKept.\n',
+        )
+        site = _build(sample_project)
+        page = site / "posts" / "kept" / "index.html"
+        before = page.stat()
+
+        _build(sample_project)
+        after = page.stat()
+
+        assert (after.st_ino, after.st_mtime_ns) == (before.st_ino, before.st_mtime_ns)
+
+    def test_removed_post_output_is_deleted(self, sample_project):
+        """Outputs from content that no longer exists are removed."""
+        posts_dir = sample_project / "content" / "posts"
+        for slug in ("kept", "gone"):
+            _write_post(
+                posts_dir,
+                f"2025-10-17-{slug}.md",
+                f'---\ntitle: "{slug}"\ndate: 2025-10-17\n---\n\nBody.\n',
+            )
+        site = _build(sample_project)
+        assert (site / "posts" / "gone" / "index.html").exists()
+
+        (posts_dir / "2025-10-17-gone.md").unlink()
+        site = _build(sample_project)
+
+        assert not (site / "posts" / "gone").exists()
+        assert (site / "posts" / "kept" / "index.html").exists()
+
+    def test_rebuild_renders_only_changed_posts(self, sample_project):
+        """Unchanged posts are served from the render cache on rebuild."""
+        posts_dir = sample_project / "content" / "posts"
+        for slug in ("same", "edited"):
+            _write_post(
+                posts_dir,
+                f"2025-10-17-{slug}.md",
+                f'---\ntitle: "{slug}"\ndate: 2025-10-17\n---\n\nBody.\n',
+            )
+        _build(sample_project)
+        _write_post(
+            posts_dir,
+            "2025-10-17-edited.md",
+            '---\ntitle: "edited"\ndate: 2025-10-17\n---\n\nNew body.\n',
+        )
+
+        with patch.object(
+            TemplateRenderer,
+            "render_post",
+            autospec=True,
+            side_effect=lambda self, post, config: f"<p>{post['content']}</p>",
+        ) as render_post:
+            site = _build(sample_project)
+
+        rendered = [call.args[1]["slug"] for call in render_post.call_args_list]
+        assert rendered == ["edited"]
+        assert "Body." in (site / "posts" / "same" / "index.html").read_text()
+        assert "New body." in (site / "posts" / "edited" / "index.html").read_text()
+
+    def test_missing_manifest_falls_back_to_full_clean(self, sample_project):
+        """Without a manifest from the last build the output dir is wiped."""
+        site = _build(sample_project)
+        (site / "stray.html").write_text("stray")
+        (sample_project / ".cache" / "outputs" / "manifest.json").unlink()
+
+        site = _build(sample_project)
+
+        assert not (site / "stray.html").exists()
+        assert (site / "static" / "style.css").exists()
+
+    def test_unchanged_project_skips_build(self, sample_project):
+        """A rebuild with identical inputs and outputs does no work."""
+        _build(sample_project)
+
+        with patch.object(SiteGenerator, "process_content") as process_content:
+            _build(sample_project)
+
+        process_content.assert_not_called()
+
+    def test_touched_content_triggers_build(self, sample_project):
+        """A content file with a new mtime is picked up by the next build."""
+        posts_dir = sample_project / "content" / "posts"
+        _write_post(
+            posts_dir,
+            "2025-10-17-touched.md",
+            '---\ntitle: "Touched"\ndate: 2025-10-17\n---\n\nBody.\n',
+        )
+        _build(sample_project)
+        post = posts_dir / "2025-10-17-touched.md"
+        stat = post.stat()
+        os.utime(post, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        with patch.object(
+            SiteGenerator,
+            "process_content",
+            autospec=True,
+            side_effect=SiteGenerator.process_content,
+        ) as process_content:
+            site = _build(sample_project)
+
+        process_content.assert_called_once()
+        assert (site / "index.html").exists()
+
+    def test_deleted_output_triggers_build(self, sample_project):
+        """An output removed since the last build is regenerated."""
+        _write_post(
+            sample_project / "content" / "posts",
+            "2025-10-17-indexed.md",
+            '---\ntitle: "Indexed"\ndate: 2025-10-17\n---\n\nBody.\n',
+        )
+        site = _build(sample_project)
+        (site / "index.html").unlink()
+
+        site = _build(sample_project)
+
+        assert (site / "index.html").exists()
+
+    def test_failed_write_is_retried_by_next_build(self, sample_project):
+        """A page that failed to write is regenerated even with no changes."""
+        _write_post(
+            sample_project / "content" / "posts",
+            "2025-10-17-full.md",
+            '---\ntitle: "Full"\ndate: 2025-10-17\n---\n\nBody.\n',
+        )
+        write_file = core.write_file
+
+        def fail_post(path, *args, **kwargs):
+            if path.parent.name == "full":
+                raise OSError(errno.ENOSPC, "No space left on device")
+            write_file(path, *args, **kwargs)
+
+        with patch.object(core, "write_file", fail_post):
+            site = _build(sample_project)
+        assert not (site / "posts" / "full" / "index.html").exists()
+
+        site = _build(sample_project)
+
+        assert (site / "posts" / "full" / "index.html").exists()
+
+    def test_deleted_static_asset_triggers_build(self, sample_project):
+        """An asset removed from the output is copied again."""
+        site = _build(sample_project)
+        (site / "static" / "style.css").unlink()
+
+        site = _build(sample_project)
+
+        assert (site / "static" / "style.css").exists()
+
+    def test_linked_static_asset_change_triggers_build(self, sample_project, tmp_path):
+        """Assets reached through a symlinked directory are fingerprinted."""
+        shared = tmp_path / "shared"
+        shared.mkdir()
+        (shared / "theme.css").write_text("old")
+        (sample_project / "static" / "shared").symlink_to(shared)
+        site = _build(sample_project)
+
+        (shared / "theme.css").write_text("new!")
+        site = _build(sample_project)
+
+        assert (site / "static" / "shared" / "theme.css").read_text() == "new!"
+
+    @pytest.mark.parametrize("target", ["markdown.__version__", "jinja2.__version__"])
+    def test_library_upgrade_triggers_build(self, sample_project, monkeypatch, target):
+        """A new Markdown or Jinja2 version is never skipped as up to date."""
+        _build(sample_project)
+        monkeypatch.setattr(target, "0.0.0")
+
+        with patch.object(
+            SiteGenerator,
+            "process_content",
+            autospec=True,
+            side_effect=SiteGenerator.process_content,
+        ) as process_content:
+            _build(sample_project)
+
+        process_content.assert_called_once()
+
+    def test_parse_cache_keeps_only_entries_in_use(self, sample_project):
+        """Entries for superseded content are pruned after each build."""
+        posts_dir = sample_project / "content" / "posts"
+        for body in ("First.", "Second.", "Third."):
+            _write_post(
+                posts_dir,
+                "2025-10-17-edited.md",
+                f'---\ntitle: "Edited"\ndate: 2025-10-17\n---\n\n{body}\n',
+            )
+            _build(sample_project)
+
+        assert len(list((sample_project / ".cache" / "parsed").iterdir())) == 1
+
+    def test_render_cache_keeps_only_entries_in_use(self, sample_project):
+        """Pages rendered under an older config are pruned from the cache."""
+        _write_post(
+            sample_project / "content" / "posts",
+            "2025-10-17-post.md",
+            '---\ntitle: "Post"\ndate: 2025-10-17\ntags: [a]\n---\n\nBody.\n',
+        )
+        config = sample_project / "config.yaml"
+        rendered = sample_project / ".cache" / "rendered"
+        _build(sample_project)
+        entries = len(list(rendered.iterdir()))
+
+        for old, new in (("Test Blog", "Renamed"), ("Renamed", "Renamed Again")):
+            config.write_text(config.read_text().replace(old, new, 1))
+            site = _build(sample_project)
+
+        assert "Renamed Again" in (site / "index.html").read_text()
+
+        assert entries > 0
+        assert len(list(rendered.iterdir())) == entries
+
+    def test_force_discards_cache(self, sample_project):
+        """A forced build ignores everything recorded by the last build."""
+        _build(sample_project)
+        stray = sample_project / ".cache" / "stray.html"
+        stray.write_text("stray")
+
+        with patch.object(
+            SiteGenerator,
+            "process_content",
+            autospec=True,
+            side_effect=SiteGenerator.process_content,
+        ) as process_content:
+            SiteGenerator(sample_project).build(force=True)
+
+        process_content.assert_called_once()
+        assert not stray.exists()
+        assert (sample_project / "site" / "sitemap.xml").exists()
+
+
+class TestAssetCopy:
+    """Tests for copying static assets alongside page rendering."""
+
+    def test_assets_copied_off_the_main_thread(self, sample_project):
+        """Static assets are copied on a background thread by default."""
+        threads = []
+        copy_assets = SiteGenerator.copy_assets
+
+        def record(self):
+            threads.append(threading.current_thread())
+            copy_assets(self)
+
+        with patch.object(SiteGenerator, "copy_assets", record):
+            site = _build(sample_project)
+
+        assert threads and threads[0] is not threading.main_thread()
+        assert (site / "static" / "style.css").exists()
+
+    def test_serial_build_copies_inline(self, sample_project):
+        """With jobs=1 the copy runs on the calling thread."""
+        threads = []
+
+        with patch.object(
+            SiteGenerator,
+            "copy_assets",
+            lambda self: threads.append(threading.current_thread()),
+        ):
+            SiteGenerator(sample_project, jobs=1).build()
+
+        assert threads == [threading.main_thread()]
+
+    def test_page_slug_cannot_claim_static_dir(self, sample_project, caplog):
+        """A page slugged 'static' is renamed instead of racing the asset copy."""
+        _write_page(
+            sample_project / "content" / "pages",
+            "static.md",
+            '---\ntitle: "Static"\ndate: 2025-10-17\n---\n\nAbout assets.\n',
+        )
+
+        site = _build(sample_project)
+
+        assert "About assets." in (site / "static-2" / "index.html").read_text()
+        assert sorted(p.name for p in (site / "static").iterdir()) == ["style.css"]
+        assert "'static' -> 'static-2'" in caplog.text
+
+    def test_copy_error_fails_build(self, sample_project):
+        """An error from the background copy propagates out of build()."""
+        with patch.object(
+            SiteGenerator, "copy_assets", side_effect=OSError("disk full")
+        ):
+            with pytest.raises(OSError, match="disk full"):
+                _build(sample_project)
+
+
+class TestParallelRendering:
+    """Tests for rendering large batches in worker processes."""
+
+    def test_large_build_renders_every_post(self, sample_project, caplog):
+        """Posts above the render-pool threshold are all written."""
+        posts_dir = sample_project / "content" / "posts"
+        for i in range(70):
+            _write_post(
+                posts_dir,
+                f"2025-01-01-post-{i}.md",
+                f'---\ntitle: "Post {i}"\ndate: 2025-01-01\n---\n\nBody {i}.\n',
+            )
+        _write_post(
+            posts_dir,
+            "2025-01-01-bad.md",
+            '---\ntitle: "Bad"\ndate: 2025-01-01\nslug: "a..b"\n---\n\nBad.\n',
+        )
+
+        SiteGenerator(sample_project, jobs=2).build()
+
+        site = sample_project / "site"
+        for i in range(70):
+            page = site / "posts" / f"post-{i}" / "index.html"
+            assert f"Post {i}" in page.read_text()
+        assert "Error generating post 'Bad' (a..b)" in caplog.text
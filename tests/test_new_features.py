@@ -6,6 +6,8 @@ Covers Phase 4.4-4.7 functionality added to the static site generator.
 
 from unittest.mock import Mock
 
+import pytest
+
 from static_site_gen.cli import cmd_serve, create_parser
 from static_site_gen.generator.core import SiteGenerator
 
@@ -51,6 +53,25 @@ class TestDraftsFlag:
         args = parser.parse_args(["build"])
         assert args.drafts is False
 
+    def test_build_parser_jobs_flag(self):
+        """Build subcommand accepts -j/--jobs and defaults to automatic."""
+        parser = create_parser()
+        assert parser.parse_args(["build"]).jobs == 0
+        assert parser.parse_args(["build", "-j", "1"]).jobs == 1
+        assert parser.parse_args(["build", "--jobs", "4"]).jobs == 4
+
+    def test_build_parser_force_flag(self):
+        """Build subcommand accepts --force and defaults to using the cache."""
+        parser = create_parser()
+        assert parser.parse_args(["build"]).force is False
+        assert parser.parse_args(["build", "--force"]).force is True
+
+    def test_build_parser_rejects_negative_jobs(self):
+        """A negative worker count is a usage error."""
+        parser = create_parser()
+        with pytest.raises(SystemExit):
+            parser.parse_args(["build", "--jobs", "-2"])
+
     def test_build_with_drafts_includes_draft_posts(
         self, sample_project, draft_post_content
     ):
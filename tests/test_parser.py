@@ -6,12 +6,20 @@ covering various scenarios including edge cases and error conditions.
 """
 
 import datetime as dt
+import importlib.metadata
+import os
+import pickle
+from dataclasses import replace
 from datetime import datetime
+from pathlib import Path
 from textwrap import dedent
+from typing import Any
 from zoneinfo import ZoneInfo
 
+import markdown
 import pytest
 
+from static_site_gen.generator import parser
 from static_site_gen.generator.parser import (
     ContentMetadata,
     ParsedContent,
@@ -19,6 +27,7 @@ from static_site_gen.generator.parser import (
     extract_front_matter,
     generate_slug,
     parse_content_file,
+    parse_content_file_cached,
     parse_date,
     validate_front_matter,
 )
@@ -70,6 +79,15 @@ class TestExtractFrontMatter:
         assert front_matter == {}
         assert "# Content Only" in body
 
+    def test_dashes_inside_value_do_not_close_front_matter(self, tmp_path):
+        """Test that only a '---' at the start of a line ends front matter."""
+        content = '---\ntitle: "Before---After"\ndate: 2025-10-17\n---\n\nBody'
+
+        front_matter, body = extract_front_matter(content, tmp_path / "test.md")
+
+        assert front_matter["title"] == "Before---After"
+        assert body == "Body"
+
     def test_missing_front_matter(self, tmp_path):
         """Test error when front matter is missing."""
         content = "# Just Content"
@@ -212,6 +230,17 @@ class TestParseDate:
         with pytest.raises(ParseError, match="Invalid date format"):
             parse_date("17-10-2025", filepath, timezone="UTC")
 
+    def test_date_string_outside_iso_fast_path(self, tmp_path):
+        """Forms fromisoformat would reject or widen still follow strptime."""
+        filepath = tmp_path / "test.md"
+
+        result = parse_date("2025-1-7", filepath, timezone="UTC")
+        assert result == datetime(2025, 1, 7, tzinfo=ZoneInfo("UTC"))
+
+        for value in ("2025-10-17T14:30", "2025-13-01", "20251017"):
+            with pytest.raises(ParseError, match="Invalid date format"):
+                parse_date(value, filepath, timezone="UTC")
+
     def test_invalid_date_type(self, tmp_path):
         """Test error with invalid date type."""
         filepath = tmp_path / "test.md"
@@ -269,6 +298,20 @@ class TestGenerateSlug:
         result2 = generate_slug("!@#$%^&*()")
         assert result == result2
 
+    def test_ascii_title_keeps_underscores_and_short_slugs(self):
+        """The ASCII fast path strips the same characters as the regex path."""
+        assert generate_slug("snake_case: a\tb") == "snake_case-a-b"
+        assert generate_slug("Go!") == "go"
+
+    def test_repeated_title_is_memoized(self):
+        """A repeated title is served from the cache."""
+        generate_slug.cache_clear()
+        generate_slug("Cached Title")
+        generate_slug("Cached Title")
+
+        info = generate_slug.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
 
 class TestContentMetadata:
     """Test ContentMetadata dataclass."""
@@ -310,6 +353,94 @@ class TestContentMetadata:
         # Empty and whitespace-only tags should be filtered out
         assert metadata.tags == ["python", "testing"]
 
+    def test_metadata_tags_are_interned(self):
+        """Equal tags on different posts share one string object."""
+        first = ContentMetadata(
+            title="A", date=datetime(2025, 10, 17), slug="a", tags=[" Python"]
+        )
+        second = ContentMetadata(
+            title="B", date=datetime(2025, 10, 18), slug="b", tags=["PYTHON "]
+        )
+
+        assert first.tags and second.tags
+        assert first.tags[0] is second.tags[0]
+
+
+class TestParsedContent:
+    """Test ParsedContent template conversion."""
+
+    def _make(self, slug="test-post"):
+        metadata = ContentMetadata(
+            title="Test Post", date=datetime(2025, 10, 17), slug=slug
+        )
+        return ParsedContent(
+            metadata=metadata,
+            content="<p>Body</p>",
+            filepath=Path("test.md"),
+        )
+
+    def test_to_dict_is_built_once(self):
+        """Repeated calls share a single dictionary."""
+        parsed = self._make()
+        assert parsed.to_dict() is parsed.to_dict()
+        assert parsed.to_dict()["content"] == "<p>Body</p>"
+
+    def test_instances_have_no_instance_dict(self):
+        """Slotted instances carry no per-object __dict__."""
+        parsed = self._make()
+        assert not hasattr(parsed, "__dict__")
+        assert not hasattr(parsed.metadata, "__dict__")
+
+    def test_raw_content_is_read_from_disk(self, tmp_path):
+        """Source text is re-read from disk when it was not retained."""
+        source = tmp_path / "post.md"
+        source.write_text("---\ntitle: Test\n---\nBody", encoding="utf-8")
+        parsed = replace(self._make(), filepath=source)
+
+        assert parsed.raw_content is None
+        assert parsed.read_raw_content() == "---\ntitle: Test\n---\nBody"
+
+    def test_raw_content_is_accepted_by_the_constructor(self, tmp_path):
+        """A retained raw_content is returned without touching the file."""
+        parsed = ParsedContent(
+            metadata=self._make().metadata,
+            content="<p>Body</p>",
+            raw_content="Body",
+            filepath=tmp_path / "missing.md",
+        )
+
+        assert parsed.raw_content == "Body"
+        assert parsed.read_raw_content() == "Body"
+
+    def test_raw_content_is_keyword_only(self, tmp_path):
+        """The pre-existing positional order is rejected, not misassigned."""
+        # Typed as a variadic tuple so the type checker accepts the call that
+        # is expected to fail at runtime.
+        args: tuple[Any, ...] = (
+            self._make().metadata,
+            "<p>Body</p>",
+            "Body",
+            tmp_path / "post.md",
+        )
+        with pytest.raises(TypeError):
+            ParsedContent(*args)
+
+    def test_round_trips_through_pickle(self):
+        """Slotted instances still pickle, as the parse cache relies on."""
+        parsed = self._make()
+        restored = pickle.loads(pickle.dumps(parsed))
+        assert restored == parsed
+
+    def test_replace_rebuilds_dict(self):
+        """A replaced copy reflects its new metadata, not the cached dict."""
+        parsed = self._make()
+        parsed.to_dict()
+
+        renamed = replace(parsed, metadata=replace(parsed.metadata, slug="renamed"))
+
+        assert renamed.to_dict()["slug"] == "renamed"
+        assert parsed.to_dict()["slug"] == "test-post"
+
 
 class TestParseContentFile:
     """Test complete file parsing functionality."""
@@ -355,7 +486,7 @@ class TestParseContentFile:
         assert "<p>This is the content of my test post.</p>" in result.content
         assert '<h2 id="subsection">Subsection</h2>' in result.content
         assert result.filepath == filepath
-        assert result.raw_content == content
+        assert result.read_raw_content() == content
 
     def test_minimal_valid_file(self, tmp_path):
         """Test parsing file with only required fields."""
@@ -462,6 +593,174 @@ class TestParseContentFile:
         with pytest.raises(ParseError, match="File encoding error"):
             parse_content_file(filepath, timezone="UTC")
 
+    def test_consecutive_files_do_not_share_converter_state(self, tmp_path):
+        """Heading ids start fresh for each file despite the shared converter."""
+        content = '---\ntitle: "Post"\ndate: 2025-10-17\n---\n\n# Intro\n'
+        first = tmp_path / "first.md"
+        second = tmp_path / "second.md"
+        first.write_text(content)
+        second.write_text(content)
+
+        first_result = parse_content_file(first, ["toc"])
+        second_result = parse_content_file(second, ["toc"])
+
+        assert '<h1 id="intro">' in first_result.content
+        assert second_result.content == first_result.content
+
+    def test_unrendered_draft_keeps_metadata(self, tmp_path):
+        """A draft parsed with render_drafts=False has metadata but no body."""
+        filepath = tmp_path / "draft.md"
+        filepath.write_text(
+            '---\ntitle: "Draft"\ndate: 2025-10-17\ndraft: true\n---\n\nBody.\n'
+        )
+
+        result = parse_content_file(filepath, render_drafts=False)
+
+        assert result.metadata.draft is True
+        assert result.metadata.slug == "draft"
+        assert result.content == ""
+
+    def test_render_drafts_false_still_renders_published(self, tmp_path):
+        """Only drafts skip conversion when render_drafts is False."""
+        filepath = tmp_path / "post.md"
+        filepath.write_text('---\ntitle: "Post"\ndate: 2025-10-17\n---\n\nBody.\n')
+
+        result = parse_content_file(filepath, render_drafts=False)
+
+        assert "<p>Body.</p>" in result.content
+
+
+class TestParseContentFileCached:
+    """Test the content-hash parse cache."""
+
+    def _write_post(self, path, body):
+        path.write_text(f'---\ntitle: "Cached"\ndate: 2025-10-17\n---\n\n{body}\n')
+
+    def test_miss_writes_cache_entry(self, tmp_path):
+        """First parse stores one cache entry and matches the uncached result."""
+        filepath = tmp_path / "post.md"
+        self._write_post(filepath, "Hello")
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+
+        result = parse_content_file_cached(filepath, cache_dir)
+
+        assert result.content == parse_content_file(filepath).content
+        assert len(list(cache_dir.glob("*.pkl"))) == 1
+
+    def test_hit_skips_parsing(self, tmp_path, monkeypatch):
+        """Unchanged content is served from the cache without re-parsing."""
+        filepath = tmp_path / "post.md"
+        self._write_post(filepath, "Hello")
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+        parse_content_file_cached(filepath, cache_dir)
+
+        def fail(*_args, **_kwargs):
+            raise AssertionError("cache hit should not re-parse")
+
+        monkeypatch.setattr("static_site_gen.generator.parser._parse_text", fail)
+        result = parse_content_file_cached(filepath, cache_dir)
+
+        assert "<p>Hello</p>" in result.content
+        assert result.filepath == filepath
+
+    def test_edit_invalidates_entry(self, tmp_path):
+        """Changing file bytes produces a fresh parse."""
+        filepath = tmp_path / "post.md"
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+
+        self._write_post(filepath, "Before")
+        parse_content_file_cached(filepath, cache_dir)
+        self._write_post(filepath, "After")
+        result = parse_content_file_cached(filepath, cache_dir)
+
+        assert "<p>After</p>" in result.content
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            b"not a pickle",
+            b"\x80\x09.",  # unknown protocol: ValueError
+            b"cno_such_module_xyz\nthing\n.",  # ModuleNotFoundError
+            None,  # truncated
+        ],
+    )
+    def test_corrupt_entry_is_treated_as_miss(self, tmp_path, payload):
+        """A corrupt or foreign cache file is ignored and overwritten."""
+        filepath = tmp_path / "post.md"
+        self._write_post(filepath, "Hello")
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+        parse_content_file_cached(filepath, cache_dir)
+        (entry,) = cache_dir.glob("*.pkl")
+        if payload is None:
+            payload = entry.read_bytes()[:20]
+        entry.write_bytes(payload)
+
+        result = parse_content_file_cached(filepath, cache_dir)
+
+        assert "<p>Hello</p>" in result.content
+        assert entry.read_bytes() != payload
+
+    def test_unrendered_draft_is_not_cached(self, tmp_path):
+        """A draft parsed without its body never satisfies a later full parse."""
+        filepath = tmp_path / "draft.md"
+        filepath.write_text(
+            '---\ntitle: "Draft"\ndate: 2025-10-17\ndraft: true\n---\n\nBody.\n'
+        )
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+
+        skipped = parse_content_file_cached(filepath, cache_dir, render_drafts=False)
+        rendered = parse_content_file_cached(filepath, cache_dir)
+
+        assert skipped.content == ""
+        assert "<p>Body.</p>" in rendered.content
+
+    def test_library_upgrade_invalidates_entry(self, tmp_path, monkeypatch):
+        """A new Markdown or Pygments version never reuses older entries."""
+        filepath = tmp_path / "post.md"
+        self._write_post(filepath, "Hello")
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+        parse_content_file_cached(filepath, cache_dir)
+
+        monkeypatch.setattr(markdown, "__version__", "0.0.0")
+        parse_content_file_cached(filepath, cache_dir)
+        monkeypatch.setattr(parser, "_pygments_version", lambda: "0.0.0")
+        parse_content_file_cached(filepath, cache_dir)
+        parse_content_file_cached(filepath, cache_dir, markdown_extensions=["toc"])
+        monkeypatch.setattr(parser, "_pygments_version", lambda: "0.0.1")
+        parse_content_file_cached(filepath, cache_dir, markdown_extensions=["toc"])
+
+        assert len(list(cache_dir.glob("*.pkl"))) == 4
+
+    def test_missing_pygments_has_no_version(self, monkeypatch):
+        """Without Pygments installed the highlighter version is None."""
+
+        def not_found(name):
+            raise importlib.metadata.PackageNotFoundError(name)
+
+        monkeypatch.setattr(importlib.metadata, "version", not_found)
+
+        assert parser._pygments_version.__wrapped__() is None
+
+    def test_hit_refreshes_entry_mtime(self, tmp_path):
+        """Reading an entry marks it as used for cache pruning."""
+        filepath = tmp_path / "post.md"
+        self._write_post(filepath, "Hello")
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+        parse_content_file_cached(filepath, cache_dir)
+        (entry,) = cache_dir.glob("*.pkl")
+        os.utime(entry, ns=(0, 0))
+
+        parse_content_file_cached(filepath, cache_dir)
+
+        assert entry.stat().st_mtime_ns > 0
+
 
 class TestParseError:
     """Test ParseError exception formatting."""
@@ -5,10 +5,16 @@ These tests target specific uncovered functionality in template rendering,
 error handling, and edge cases.
 """
 
+import hashlib
+import os
+from datetime import datetime
+from unittest.mock import patch
+
 import pytest
 from jinja2 import TemplateNotFound, TemplateSyntaxError
 
-from static_site_gen.generator.renderer import TemplateRenderer
+from static_site_gen.generator.config import SiteConfig
+from static_site_gen.generator.renderer import RenderCache, TemplateRenderer
 
 
 class TestRendererEdgeCases:
@@ -147,6 +153,94 @@ class TestRendererEdgeCases:
         assert "&lt;script&gt;" in result
         assert "<script>" not in result
 
+    def test_available_templates_scanned_once(self, tmp_path):
+        """Test that the template directory listing is cached per renderer."""
+        templates_dir = tmp_path / "templates"
+        templates_dir.mkdir()
+        (templates_dir / "post.html").write_text("post")
+        (templates_dir / "partials").mkdir()
+
+        renderer = TemplateRenderer(templates_dir)
+        with patch(
+            "static_site_gen.generator.renderer.os.scandir", wraps=os.scandir
+        ) as scandir:
+            first = renderer.get_available_templates()
+            first.append("mutated.html")
+            second = renderer.get_available_templates()
+
+        assert scandir.call_count == 1
+        assert second == ["post.html"]
+
+    def test_render_cache_key_tracks_inputs_and_templates(self, tmp_path):
+        """Test that render cache keys change with arguments and templates."""
+        templates_dir = tmp_path / "templates"
+        (templates_dir / "partials").mkdir(parents=True)
+        partial = templates_dir / "partials" / "footer.html"
+        partial.write_text("footer")
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+
+        cache = RenderCache(cache_dir, templates_dir)
+        key = cache.key("render_post", ({"slug": "a"},))
+        assert key == cache.key("render_post", ({"slug": "a"},))
+        assert key != cache.key("render_post", ({"slug": "b"},))
+        assert cache.key("render_post", (lambda: None,)) is None
+
+        assert key is not None and cache.get(key) is None
+        cache.put(key, "<p>cached</p>")
+        os.utime(cache_dir / f"{key}.html", ns=(0, 0))
+        assert cache.get(key) == "<p>cached</p>"
+        assert (cache_dir / f"{key}.html").stat().st_mtime_ns > 0
+
+        partial.write_text("edited footer")
+        assert (
+            RenderCache(cache_dir, templates_dir).key("render_post", ({"slug": "a"},))
+            != key
+        )
+
+    def test_render_cache_key_depends_only_on_values(self, tmp_path):
+        """Equal arguments share a key however their strings are shared."""
+        templates_dir = tmp_path / "templates"
+        templates_dir.mkdir()
+        cache = RenderCache(tmp_path, templates_dir)
+        config = SiteConfig(
+            site_name="Test", base_url="https://example.com", author="Test"
+        )
+        tag = "python"
+        shared = {"tags": [tag], "title": tag, "date": datetime(2025, 10, 17)}
+        distinct = {
+            "title": "python",
+            "date": datetime(2025, 10, 17),
+            "tags": ["".join(["py", "thon"])],
+        }
+
+        key = cache.key("render_post", (shared, config))
+        assert key is not None
+        assert key == cache.key("render_post", (distinct, config))
+        other = SiteConfig(
+            site_name="Other", base_url="https://example.com", author="Test"
+        )
+        assert key != cache.key("render_post", (distinct, other))
+
+    def test_render_cache_hashes_listed_bodies_once(self, tmp_path):
+        """Listing keys track post bodies without re-encoding them per page."""
+        templates_dir = tmp_path / "templates"
+        templates_dir.mkdir()
+        cache = RenderCache(tmp_path, templates_dir)
+        post = {"slug": "a", "content": "<p>Body</p>"}
+
+        with patch(
+            "static_site_gen.generator.renderer.hashlib.blake2b",
+            wraps=hashlib.blake2b,
+        ) as blake2b:
+            key = cache.key("render_tag_page", ("a", [post]))
+            cache.key("render_tag_page", ("b", [post]))
+        # One digest of the body, plus one per key.
+        assert blake2b.call_count == 3
+
+        edited = {"slug": "a", "content": "<p>Edited</p>"}
+        assert key != cache.key("render_tag_page", ("a", [edited]))
+
     def test_template_with_filters_and_functions(self, tmp_path):
         """Test templates using Jinja2 built-in filters."""
         templates_dir = tmp_path / "templates"
@@ -224,3 +318,34 @@ class TestRendererEdgeCases:
         assert "Test Post" in result
         assert "Test content" in result
         assert "<article>" in result
+
+    def test_bytecode_cache_persists_compiled_templates(self, tmp_path):
+        """Test that compiled templates are reused by a later renderer."""
+        templates_dir = tmp_path / "templates"
+        templates_dir.mkdir()
+        (templates_dir / "hello.html").write_text("Hello {{ name }}")
+        cache_dir = tmp_path / "jinja"
+        cache_dir.mkdir()
+
+        first = TemplateRenderer(templates_dir, cache_dir)
+        assert first.render_template("hello.html", {"name": "A"}) == "Hello A"
+        assert list(cache_dir.glob("__jinja2_*.cache"))
+
+        second = TemplateRenderer(templates_dir, cache_dir)
+        assert second.render_template("hello.html", {"name": "B"}) == "Hello B"
+
+    def test_template_is_looked_up_once_per_renderer(self, tmp_path):
+        """Test that repeated renders reuse the resolved template."""
+        templates_dir = tmp_path / "templates"
+        templates_dir.mkdir()
+        (templates_dir / "hello.html").write_text("Hello {{ name }}")
+
+        renderer = TemplateRenderer(templates_dir)
+        with patch.object(
+            renderer.env, "get_template", wraps=renderer.env.get_template
+        ) as get_template:
+            renderer.render_template("hello.html", {"name": "A"})
+            result = renderer.render_template("hello.html", {"name": "B"})
+
+        assert result == "Hello B"
+        get_template.assert_called_once_with("hello.html")
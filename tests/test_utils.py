@@ -5,6 +5,8 @@ These tests cover file operations, URL generation, and data manipulation
 functions used throughout the site generation process.
 """
 
+import os
+import urllib.parse
 from datetime import datetime
 from typing import Any
 
@@ -15,14 +17,21 @@ from static_site_gen.generator.output import (
     collect_posts_by_tag,
     copy_static_files,
     ensure_dir,
+    ensure_dirs,
     filter_published_posts,
     generate_page_url,
     generate_pagination_url,
     generate_post_url,
     generate_tag_url,
+    mark_cache_epoch,
     paginate_posts,
+    prepare_posts,
+    prune_cache_dir,
+    read_output_manifest,
+    remove_stale_files,
     sort_posts_by_date,
     write_file,
+    write_output_manifest,
 )
 
 
@@ -49,6 +58,15 @@ class TestUtilityFunctions:
 
         assert test_dir.exists()
 
+    def test_ensure_dirs_creates_each_directory(self, tmp_path):
+        """Test that ensure_dirs creates every distinct directory."""
+        dirs = [tmp_path / "a" / "b", tmp_path / "c", tmp_path / "a" / "b"]
+
+        ensure_dirs(dirs)
+
+        assert (tmp_path / "a" / "b").is_dir()
+        assert (tmp_path / "c").is_dir()
+
     def test_copy_static_files_success(self, tmp_path):
         """Test successful static file copying."""
         source_dir = tmp_path / "source"
@@ -103,6 +121,48 @@ class TestUtilityFunctions:
         assert (dest_dir / "file.txt").exists()
         assert (dest_dir / "file.txt").read_text() == "new content"
 
+    def test_copy_static_files_skips_unchanged_and_prunes_orphans(self, tmp_path):
+        """Test that a re-copy only touches changed, new, and removed files."""
+        source_dir = tmp_path / "source"
+        dest_dir = tmp_path / "dest"
+        (source_dir / "css").mkdir(parents=True)
+        (source_dir / "css" / "site.css").write_text("a")
+        (source_dir / "old.js").write_text("old")
+        (source_dir / "logo.svg").write_text("<svg/>")
+        copy_static_files(source_dir, dest_dir)
+        unchanged_inode = (dest_dir / "css" / "site.css").stat().st_ino
+
+        (source_dir / "old.js").unlink()
+        (source_dir / "logo.svg").write_text("<svg></svg>")
+        (source_dir / "img").mkdir()
+        (source_dir / "img" / "new.png").write_bytes(b"png")
+        copy_static_files(source_dir, dest_dir)
+
+        assert (dest_dir / "css" / "site.css").stat().st_ino == unchanged_inode
+        assert not (dest_dir / "old.js").exists()
+        assert (dest_dir / "logo.svg").read_text() == "<svg></svg>"
+        assert (dest_dir / "img" / "new.png").read_bytes() == b"png"
+
+    @pytest.mark.parametrize("kernel_copy", [True, False])
+    def test_copy_static_files_preserves_bytes_and_mtime(
+        self, tmp_path, monkeypatch, kernel_copy
+    ):
+        """Test copies match the source with or without os.copy_file_range."""
+        if not kernel_copy:
+            monkeypatch.delattr(os, "copy_file_range", raising=False)
+        source_dir = tmp_path / "source"
+        dest_dir = tmp_path / "dest"
+        source_dir.mkdir()
+        data = os.urandom(256 * 1024)
+        (source_dir / "font.woff2").write_bytes(data)
+        os.utime(source_dir / "font.woff2", ns=(10**18, 10**18))
+
+        copy_static_files(source_dir, dest_dir)
+
+        copied = dest_dir / "font.woff2"
+        assert copied.read_bytes() == data
+        assert copied.stat().st_mtime_ns == 10**18
+
     def test_generate_post_url(self):
         """Test post URL generation."""
         assert generate_post_url("my-post") == "/posts/my-post/"
@@ -114,11 +174,25 @@ class TestUtilityFunctions:
         assert generate_tag_url("C++") == "/tag/C%2B%2B/"
         assert generate_tag_url("machine learning") == "/tag/machine%20learning/"
 
+    @pytest.mark.parametrize(
+        "tag", ["python", "web-dev_2.0~", "", "café", "a/b", "100%", "日本語"]
+    )
+    def test_generate_tag_url_matches_quote(self, tag):
+        """Test that the safe-segment fast path agrees with urllib quoting."""
+        expected = f"/tag/{urllib.parse.quote(tag, safe='')}/"
+        assert generate_tag_url(tag) == expected
+
     def test_generate_page_url(self):
         """Test page URL generation."""
         assert generate_page_url("about") == "/about/"
         assert generate_page_url("contact-us") == "/contact-us/"
 
+    def test_url_generators_return_shared_strings(self):
+        """Test that repeated URL generation reuses the cached string."""
+        assert generate_post_url("cached") is generate_post_url("cached")
+        assert generate_tag_url("cached") is generate_tag_url("cached")
+        assert generate_page_url("cached") is generate_page_url("cached")
+
     def test_write_file_creates_file_and_dirs(self, tmp_path):
         """Test that write_file creates files and directories."""
         file_path = tmp_path / "nested" / "dir" / "test.txt"
@@ -130,6 +204,58 @@ class TestUtilityFunctions:
         assert file_path.read_text() == content
         assert file_path.parent.exists()
 
+    def test_write_file_accepts_bytes(self, tmp_path):
+        """Test that write_file writes pre-encoded bytes unchanged."""
+        file_path = tmp_path / "out.html"
+        data = "caf\u00e9\n".encode()
+
+        write_file(file_path, data)
+
+        assert file_path.read_bytes() == data
+
+    def test_write_file_encodes_text_as_utf8_without_translation(self, tmp_path):
+        """Test that text is written as UTF-8 with newlines untouched."""
+        file_path = tmp_path / "out.html"
+
+        write_file(file_path, "caf\u00e9\nline")
+
+        assert file_path.read_bytes() == b"caf\xc3\xa9\nline"
+
+    def test_write_file_writes_large_content_completely(self, tmp_path):
+        """Test that content far larger than one write buffer is written whole."""
+        file_path = tmp_path / "big.html"
+        data = bytes(range(256)) * (64 * 1024)
+
+        write_file(file_path, data)
+
+        assert file_path.read_bytes() == data
+
+    def test_write_file_replaces_atomically(self, tmp_path, monkeypatch):
+        """Test that a failed write keeps the old file and leaves no temp file."""
+        file_path = tmp_path / "index.html"
+        write_file(file_path, "old")
+
+        def fail_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(os, "replace", fail_replace)
+        with pytest.raises(OSError, match="disk full"):
+            write_file(file_path, "new")
+
+        assert file_path.read_text() == "old"
+        assert [p.name for p in tmp_path.iterdir()] == ["index.html"]
+
+    def test_write_file_assume_dir_exists_skips_mkdir(self, tmp_path):
+        """Test that assume_dir_exists leaves directory creation to the caller."""
+        file_path = tmp_path / "missing" / "out.html"
+
+        with pytest.raises(FileNotFoundError):
+            write_file(file_path, "x", assume_dir_exists=True)
+
+        file_path.parent.mkdir()
+        write_file(file_path, "x", assume_dir_exists=True)
+        assert file_path.read_text() == "x"
+
     def test_collect_posts_by_tag(self):
         """Test collecting posts by tags."""
         posts: list[dict[str, Any]] = [
@@ -147,6 +273,41 @@ class TestUtilityFunctions:
         assert len(result["data"]) == 1
         assert "nonexistent" not in result
 
+    def test_collect_posts_by_tag_preserves_input_order(self):
+        """Test that each tag lists its posts in input order."""
+        posts: list[dict[str, Any]] = [
+            {"title": "C", "tags": ["x"]},
+            {"title": "A", "tags": ["x", "y"]},
+            {"title": "B", "tags": ["x"]},
+        ]
+
+        result = collect_posts_by_tag(posts)
+
+        assert [p["title"] for p in result["x"]] == ["C", "A", "B"]
+
+    def test_prepare_posts_filters_sorts_and_groups(self):
+        """Test that prepare_posts matches filter, sort, then group."""
+        posts: list[dict[str, Any]] = [
+            {"title": "Old", "date": datetime(2020, 1, 1), "tags": ["a"]},
+            {
+                "title": "Draft",
+                "date": datetime(2024, 1, 1),
+                "tags": ["a"],
+                "draft": True,
+            },
+            {"title": "New", "date": datetime(2025, 1, 1), "tags": ["a", "b"]},
+        ]
+
+        published, by_tag = prepare_posts(posts)
+
+        assert [p["title"] for p in published] == ["New", "Old"]
+        assert [p["title"] for p in by_tag["a"]] == ["New", "Old"]
+        assert [p["title"] for p in by_tag["b"]] == ["New"]
+
+        with_drafts, _ = prepare_posts(posts, include_drafts=True)
+        assert [p["title"] for p in with_drafts] == ["New", "Draft", "Old"]
+        assert [p["title"] for p in posts] == ["Old", "Draft", "New"]
+
     def test_sort_posts_by_date_newest_first(self):
         """Test sorting posts by date (newest first)."""
         posts = [
@@ -207,6 +368,19 @@ class TestUtilityFunctions:
         assert output_dir.is_dir()
         assert len(list(output_dir.iterdir())) == 0
 
+    def test_clean_output_dir_keeps_named_entries(self, tmp_path):
+        """Test that entries listed in keep survive cleaning."""
+        output_dir = tmp_path / "site"
+        (output_dir / "static").mkdir(parents=True)
+        (output_dir / "static" / "style.css").write_text("kept")
+        (output_dir / "posts").mkdir()
+        (output_dir / "index.html").write_text("old content")
+
+        clean_output_dir(output_dir, keep=("static",))
+
+        assert [p.name for p in output_dir.iterdir()] == ["static"]
+        assert (output_dir / "static" / "style.css").read_text() == "kept"
+
     def test_clean_output_dir_with_nonexistent_dir(self, tmp_path):
         """Test cleaning nonexistent output directory."""
         output_dir = tmp_path / "nonexistent"
@@ -218,6 +392,50 @@ class TestUtilityFunctions:
         assert output_dir.is_dir()
         assert len(list(output_dir.iterdir())) == 0
 
+    def test_output_manifest_round_trip_is_read_once(self, tmp_path):
+        """A manifest is read back for its output dir and then invalidated."""
+        manifest_path = tmp_path / "manifest.json"
+        files = {"index.html": ["abc", 3, 1]}
+
+        write_output_manifest(manifest_path, tmp_path / "site", files)
+        assert read_output_manifest(manifest_path, tmp_path / "other") == {}
+
+        write_output_manifest(manifest_path, tmp_path / "site", files)
+        assert read_output_manifest(manifest_path, tmp_path / "site") == files
+        assert not manifest_path.exists()
+        assert read_output_manifest(manifest_path, tmp_path / "site") == {}
+
+    def test_remove_stale_files_prunes_empty_dirs(self, tmp_path):
+        """Removed files take their emptied parent directories with them."""
+        write_file(tmp_path / "posts" / "old" / "index.html", "old")
+        write_file(tmp_path / "posts" / "new" / "index.html", "new")
+
+        remove_stale_files(tmp_path, ["posts/old/index.html", "missing.html"])
+
+        assert not (tmp_path / "posts" / "old").exists()
+        assert (tmp_path / "posts" / "new" / "index.html").exists()
+        assert tmp_path.is_dir()
+
+    def test_prune_cache_dir_keeps_entries_used_since_epoch(self, tmp_path):
+        """Entries older than the build's epoch marker are deleted."""
+        cache_dir = tmp_path / "cache"
+        write_file(cache_dir / "parsed" / "old.pkl", "old")
+        os.utime(cache_dir / "parsed" / "old.pkl", ns=(0, 0))
+
+        epoch = mark_cache_epoch(cache_dir)
+        assert epoch is not None
+        write_file(cache_dir / "parsed" / "new.pkl", "new")
+        prune_cache_dir(cache_dir / "parsed", epoch)
+        prune_cache_dir(cache_dir / "missing", epoch)
+
+        assert [p.name for p in (cache_dir / "parsed").iterdir()] == ["new.pkl"]
+
+    def test_mark_cache_epoch_on_unwritable_dir(self, tmp_path):
+        """A cache directory that cannot be created disables pruning."""
+        (tmp_path / "file").write_text("")
+
+        assert mark_cache_epoch(tmp_path / "file" / "cache") is None
+
     def test_paginate_posts_splits_into_expected_pages(self):
         """Test pagination splits post lists correctly."""
         posts = [